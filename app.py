@@ -1,20 +1,58 @@
-import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
 
+import streamlit as st
+
+from utils.apps import APPS
+
+# Only Streamlit and the app registry are imported up front. pandas, the
+# plotting libraries and the datasets are loaded by the page that needs
+# them, so the Home page starts cold within the budget checked by
+# scripts/check_startup.py.
+
 # Set page configuration
 st.set_page_config(page_title="Zoom, Webex & Firefox Review Insights", layout="wide")
 
-# Load data for each dataset
-@st.cache_data
+# Bundled sampled datasets, by display name
+DATASETS = {app["name"]: app["sampled"] for app in APPS.values()}
+
+# Load data for each dataset on first use; the cache is shared by every
+# session and holds at most one copy of each bundled dataset
+@st.cache_data(max_entries=len(DATASETS), show_spinner="Loading reviews...")
 def load_data(file_name):
-    return pd.read_csv(file_name)
+    from utils.storage import load_reviews
+
+    # Typed Parquet (falls back to a CSV export if that is all there is)
+    return load_reviews(file_name)
+
+# Parsed uploads keyed by content hash, shared by every session and bounded
+# by total memory (utils/upload_cache.py); frames from it are read-only
+@st.cache_resource
+def upload_cache():
+    from utils.upload_cache import UploadCache
+
+    return UploadCache()
 
-zoom_data = load_data("data/zoom_with_hf_sentiment_sampled.csv")
-webex_data = load_data("data/webex_with_hf_sentiment_sampled.csv")
-firefox_data = load_data("data/firefox_with_hf_sentiment_sampled.csv")
+# Sentiment counts by app, month, version, sentiment and rating (a few KB),
+# rebuilt by the scoring scripts; None until one of them has run
+@st.cache_data(max_entries=1, ttl=600, show_spinner=False)
+def load_cube_data():
+    from utils.sentiment_cube import CUBE_PATH, load_cube
+    from utils.storage import resolve_path
+
+    return load_cube() if os.path.exists(resolve_path(CUBE_PATH)) else None
+
+def monthly_sentiment_chart(app_key, fallback_image, caption):
+    """Interactive monthly sentiment counts for one app from the cube, or the saved PNG without a cube."""
+    cube = load_cube_data()
+    if cube is None or app_key not in set(cube["app"]):
+        st.image(fallback_image, caption=caption, use_container_width=True)
+        return
+    import plotly.express as px
+    from utils.sentiment_cube import rollup
+
+    monthly = rollup(cube, ["month"], "hf_sentiment_label", app=app_key).stack().rename("reviews").reset_index()
+    fig = px.line(monthly, x="month", y="reviews", color="hf_sentiment_label", markers=True, title=caption)
+    st.plotly_chart(fig, use_container_width=True)
 
 # Sidebar navigation
 st.sidebar.title("Navigation")
@@ -72,7 +110,7 @@ elif page == "Sentiment Analysis":
         st.title("Zoom RoBERTa Sentiment Analysis")
         st.image("output/figures/roberta_sentiment_bar.png", caption="Webex Sentiment Distribution", use_container_width=True)
         st.image("output/figures/roberta_sentiment_pie.png", caption="Webex Sentiment Proportion", use_container_width=True)
-        st.image("output/figures/roberta_sentiment_over_time.png", caption="Webex Monthly Sentiment Trends", use_container_width=True)
+        monthly_sentiment_chart("zoom", "output/figures/roberta_sentiment_over_time.png", "Zoom Monthly Sentiment Trends")
         
         st.markdown("""**RoBERTa Sentiment Analysis** provides a more **accurate sentiment breakdown** compared to VADER.
         The **RoBERTa Sentiment Over Time** chart shows a clear evolution of sentiment, providing a deeper understanding of user feedback over different app versions.
@@ -82,7 +120,7 @@ elif page == "Sentiment Analysis":
         st.title("Webex Sentiment Analysis")
         st.image("output/figures/webex_roberta_sentiment_bar.png", caption="Webex Sentiment Distribution", use_container_width=True)
         st.image("output/figures/webex_roberta_sentiment_pie.png", caption="Webex Sentiment Proportion", use_container_width=True)
-        st.image("output/figures/webex_roberta_sentiment_over_time.png", caption="Webex Monthly Sentiment Trends", use_container_width=True)
+        monthly_sentiment_chart("webex", "output/figures/webex_roberta_sentiment_over_time.png", "Webex Monthly Sentiment Trends")
         
         st.markdown("""The **Webex sentiment model** shows more **nuanced polarity** than VADER, with better distinction between positive, neutral, and negative sentiments.
         The **Sentiment Trends** chart indicates fluctuation in user sentiment, potentially tied to app updates and feature releases.
@@ -92,7 +130,7 @@ elif page == "Sentiment Analysis":
         st.title("Firefox Sentiment Analysis")
         st.image("output/figures/firefox_roberta_sentiment_bar.png", caption="Firefox Sentiment Distribution", use_container_width=True)
         st.image("output/figures/firefox_roberta_sentiment_pie.png", caption="Firefox Sentiment Proportion", use_container_width=True)
-        st.image("output/figures/firefox_roberta_sentiment_over_time.png", caption="Firefox Monthly Sentiment Trends", use_container_width=True)
+        monthly_sentiment_chart("firefox", "output/figures/firefox_roberta_sentiment_over_time.png", "Firefox Monthly Sentiment Trends")
         
         st.markdown("""The **Sentiment Distribution** and **Monthly Trends** for Firefox indicate **clear shifts** in sentiment over time.
         The **Pie Chart** indicates a well-balanced sentiment between positive, neutral, and negative reviews.
@@ -105,9 +143,50 @@ elif page == "Trend Analysis":
     We'll show how user engagement and emotional responses change over time for **Zoom**, **Webex**, and **Firefox**.
     """)
     
-    st.image("output/figures/zoom_sentiment_over_time_by_version.png", caption="Zoom Sentiment Trend Comparison", use_container_width=True)
-    st.image("output/figures/webex_sentiment_over_time_by_version.png", caption="Webex Sentiment Trend Comparison", use_container_width=True)
-    st.image("output/figures/firefox_sentiment_over_time_by_version.png", caption="Firefox Sentiment Trend Comparison", use_container_width=True)
+    cube = load_cube_data()
+    if cube is not None and not set(cube["app"]) & set(APPS):
+        cube = None
+    if cube is None:
+        st.image("output/figures/zoom_sentiment_over_time_by_version.png", caption="Zoom Sentiment Trend Comparison", use_container_width=True)
+        st.image("output/figures/webex_sentiment_over_time_by_version.png", caption="Webex Sentiment Trend Comparison", use_container_width=True)
+        st.image("output/figures/firefox_sentiment_over_time_by_version.png", caption="Firefox Sentiment Trend Comparison", use_container_width=True)
+    else:
+        # Every chart below is a rollup of the precomputed cube, not of raw reviews
+        import plotly.express as px
+        from utils.sentiment_cube import rollup
+
+        app_keys = [key for key in APPS if key in set(cube["app"])]
+        selected_apps = st.multiselect("Apps", app_keys, default=app_keys, format_func=lambda key: APPS[key]["name"])
+        versions = st.multiselect("App versions", sorted(cube.loc[cube["app"].isin(selected_apps), "appVersion"].unique()),
+                                  placeholder="All versions")
+        show_shares = st.toggle("Show sentiment shares instead of review counts")
+        if not selected_apps:
+            st.info("Select at least one app.")
+            st.stop()
+        filters = {"app": selected_apps}
+        if versions:
+            filters["appVersion"] = versions
+
+        monthly = rollup(cube, ["app", "month"], "hf_sentiment_label", **filters)
+        if show_shares:
+            monthly = monthly.div(monthly.sum(axis=1), axis=0)
+        monthly = monthly.stack().rename("value").reset_index()
+        monthly["app"] = monthly["app"].map(lambda key: APPS[key]["name"])
+        fig = px.line(monthly, x="month", y="value", color="hf_sentiment_label", facet_row="app", markers=True,
+                      labels={"value": "Share of reviews" if show_shares else "Review count", "month": "Month"},
+                      title="Sentiment Over Time")
+        fig.for_each_annotation(lambda annotation: annotation.update(text=annotation.text.split("=")[-1]))
+        st.plotly_chart(fig, use_container_width=True)
+
+        col1, col2 = st.columns(2)
+        by_app = rollup(cube, ["app", "hf_sentiment_label"], **filters).reset_index()
+        by_app["app"] = by_app["app"].map(lambda key: APPS[key]["name"])
+        col1.plotly_chart(px.bar(by_app, x="hf_sentiment_label", y="reviews", color="app", barmode="group",
+                                 title="Sentiment by App"), use_container_width=True)
+        by_score = rollup(cube, ["score"], "hf_sentiment_label", **filters)
+        col2.plotly_chart(px.imshow(by_score, text_auto=True, aspect="auto", title="Star Rating vs Sentiment",
+                                    labels={"x": "Sentiment", "y": "Star rating", "color": "Reviews"}),
+                          use_container_width=True)
     
     st.markdown("""
     These trend comparisons allow us to observe how sentiment evolves over time for each of the apps. The fluctuations in user sentiment can often be tied to new app releases, features, or updates.
@@ -121,15 +200,34 @@ elif page == "Interactive KPI Explorer":
     Here, you can interactively explore the data by uploading the dataset and selecting different columns for dynamic plot generation. This will help in exploring specific relationships between features and understanding deeper insights.
     """)
     
-    # File upload option
-    uploaded_file = st.file_uploader("Upload Sentiment Analysis Dataset (Zoom, Webex, or Firefox)", type=["csv"])
+    # Plotting libraries are only needed on this page
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+    from utils.plot_data import COUNT_COLUMN, RAW_ROW_LIMIT, prepare_plot_data
 
-    if uploaded_file is not None:
-        # Load the uploaded dataset
-        df = pd.read_csv(uploaded_file)
-        
+    # Either a bundled dataset or an uploaded file
+    source = st.radio("Dataset", ["Upload a file"] + list(DATASETS), horizontal=True)
+    df = None
+    if source == "Upload a file":
+        uploaded_file = st.file_uploader("Upload Sentiment Analysis Dataset (Zoom, Webex, or Firefox)", type=["csv", "parquet"])
+        if uploaded_file is not None:
+            # Parsed (types and timestamps included) only the first time this
+            # content is seen; changing axes or plot type reuses the cached frame
+            progress_bar = st.empty()
+            df = upload_cache().load(
+                uploaded_file.getvalue(), uploaded_file.name,
+                progress=lambda fraction: progress_bar.progress(fraction, text=f"Parsing {uploaded_file.name}..."),
+            )
+            progress_bar.empty()
+            data_name = uploaded_file.name
+    else:
+        df = load_data(DATASETS[source])
+        data_name = DATASETS[source]
+
+    if df is not None:
         # Display some basic information about the dataset
-        st.write(f"Data Loaded: {uploaded_file.name}")
+        st.write(f"Data Loaded: {data_name}")
         st.write(f"Shape of Data: {df.shape}")
         st.write("Preview of the Data:")
         st.write(df.head())
@@ -140,7 +238,7 @@ elif page == "Interactive KPI Explorer":
             y_axis_options = ['score', 'hf_sentiment_label', 'reviewCount']
         else:
             x_axis_options = df.columns.tolist()
-            y_axis_options = df.columns.tolist()
+            y_axis_options = df.columns.tolist() + [COUNT_COLUMN]
         
         # Provide suggestions for good plots
         st.markdown("""
@@ -157,21 +255,27 @@ elif page == "Interactive KPI Explorer":
         # Plot type dropdown
         plot_type = st.selectbox("Select Plot Type", ["Line Plot", "Bar Plot", "Scatter Plot", "Pie Chart", "Heatmap"])
 
+        # Large inputs are bucketed, grouped or downsampled before plotting
+        raw = st.checkbox(f"Plot raw rows (slow above {RAW_ROW_LIMIT:,} rows)")
+
         # Generate Plot
         if st.button("Generate Plot"):
+            plot_df, y_plot, note = prepare_plot_data(df, x_axis, y_axis, plot_type, raw=raw)
+            if note:
+                st.caption(f"Aggregated for plotting: {note}. Tick 'Plot raw rows' to draw every row.")
             fig, ax = plt.subplots()
 
             if plot_type == "Line Plot":
-                ax.plot(df[x_axis], df[y_axis], marker='o')
+                ax.plot(plot_df[x_axis], plot_df[y_plot], marker='o')
             elif plot_type == "Bar Plot":
-                ax.bar(df[x_axis], df[y_axis])
+                ax.bar(plot_df[x_axis], plot_df[y_plot])
             elif plot_type == "Scatter Plot":
-                ax.scatter(df[x_axis], df[y_axis])
+                ax.scatter(plot_df[x_axis], plot_df[y_plot])
             elif plot_type == "Pie Chart":
-                df[y_axis].value_counts().plot.pie(autopct='%1.1f%%', ax=ax)
-                ax.set_ylabel('')
+                # Already counted; a review count has no values of its own, so it counts the X-axis values
+                ax.pie(plot_df[y_plot], labels=plot_df.iloc[:, 0], autopct='%1.1f%%')
             elif plot_type == "Heatmap":
-                pivot = pd.pivot_table(df, values=y_axis, index=x_axis, aggfunc='mean')
+                pivot = pd.pivot_table(plot_df, values=y_plot, index=x_axis, aggfunc='mean')
                 sns.heatmap(pivot, ax=ax, cmap='coolwarm')
 
             ax.set_title(f"{plot_type}: {x_axis} vs {y_axis}")
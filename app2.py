@@ -4,8 +4,12 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 import plotly.express as px
 
+from utils.emoji_sentiment import emoji_polarity
+from utils.emoji_utils import split_emojis
+from utils.storage import load_reviews
+
 # Load data
-df = pd.read_csv('data/zoom_with_emoji_sentiment.csv')
+df = load_reviews('data/zoom_with_emoji_sentiment.parquet')
 
 # Sidebar for version selection
 st.sidebar.header('Filter by Version')
@@ -46,11 +50,11 @@ st.plotly_chart(fig)
 
 # --- Emoji Distribution Plot ---
 st.header('Top Emojis and Their Sentiment')
-emoji_count = filtered_df['emojis'].explode().value_counts().reset_index()
+emoji_count = filtered_df['emojis'].dropna().astype(str).map(split_emojis).explode().value_counts().reset_index()
 emoji_count.columns = ['Emoji', 'Count']
 
 # Map sentiment to emojis
-emoji_count['Sentiment'] = emoji_count['Emoji'].map(lambda emoji: emoji_sentiment_map.get(emoji, 'neutral'))
+emoji_count['Sentiment'] = emoji_count['Emoji'].map(emoji_polarity)
 
 fig = px.bar(emoji_count, x='Emoji', y='Count', color='Sentiment', 
              title='Top Emojis and Their Sentiment', labels={'Emoji': 'Emoji', 'Count': 'Frequency'})
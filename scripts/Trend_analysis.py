@@ -1,29 +1,25 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 import os
+import sys
 
-# Load the data for each app
-zoom_df = pd.read_csv("data/zoom_with_hf_sentiment_sampled.csv")
-webex_df = pd.read_csv("data/webex_with_hf_sentiment_sampled.csv")
-firefox_df = pd.read_csv("data/firefox_with_hf_sentiment_sampled.csv")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.apps import APPS
+from utils.sentiment_cube import load_or_build_cube, rollup
 
-# Convert the 'at' column to datetime for time-based plotting
-zoom_df["at"] = pd.to_datetime(zoom_df["at"], errors="coerce")
-webex_df["at"] = pd.to_datetime(webex_df["at"], errors="coerce")
-firefox_df["at"] = pd.to_datetime(firefox_df["at"], errors="coerce")
+# Counts by app, month, version and sentiment, written by the scoring
+# scripts (or scripts/build_cube.py, or here on first use) instead of regrouping raw reviews
+cube = load_or_build_cube()
 
 # Set the output directory for saved plots
 output_dir = "output/figures"
 os.makedirs(output_dir, exist_ok=True)
 
 # Function to generate Sentiment Over Time by App Version plot
-def generate_sentiment_over_time_by_version(df, app_name):
-    # Create a new column for period (monthly granularity)
-    df["month"] = df["at"].dt.to_period("M")
+def generate_sentiment_over_time_by_version(cube, app_key):
+    app_name = APPS[app_key]["name"]
 
-    # Group by app version and sentiment, and count occurrences
-    sentiment_counts = df.groupby([df["month"], "appVersion", "hf_sentiment_label"]).size().unstack().fillna(0)
+    # Review counts per (month, app version), one column per sentiment
+    sentiment_counts = rollup(cube, ["month", "appVersion"], "hf_sentiment_label", app=app_key)
 
     # Plot sentiment distribution over time by app version
     plt.figure(figsize=(12, 6))
@@ -35,12 +31,11 @@ def generate_sentiment_over_time_by_version(df, app_name):
     plt.tight_layout()
 
     # Save the plot
-    output_file = f"{output_dir}/{app_name.lower()}_sentiment_over_time_by_version.png"
+    output_file = f"{output_dir}/{app_key}_sentiment_over_time_by_version.png"
     plt.savefig(output_file)
     plt.close()
     print(f"✅ {app_name} Sentiment Over Time by Version plot saved to: {output_file}")
 
-# Generate plots for each app
-generate_sentiment_over_time_by_version(zoom_df, "Zoom")
-generate_sentiment_over_time_by_version(webex_df, "Webex")
-generate_sentiment_over_time_by_version(firefox_df, "Firefox")
+# Generate plots for each app in the cube
+for app_key in [key for key in APPS if key in set(cube["app"])]:
+    generate_sentiment_over_time_by_version(cube, app_key)
@@ -0,0 +1,56 @@
+import pandas as pd
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.emoji_utils import emoji_pattern, extract_emojis_per_char, extract_emojis_series
+from utils.storage import read_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the per-character and trie-regex emoji extractors")
+    parser.add_argument("--input", default="data/cleaned_zoom_reviews.parquet", help="Reviews with a `content` column")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of reviews to extract from")
+    args = parser.parse_args()
+
+    # -----------------------------
+    # Load benchmark texts
+    # -----------------------------
+    texts = read_dataset(args.input, columns=["content"])["content"].fillna("").astype(str)
+    texts = pd.concat([texts] * (args.rows // max(len(texts), 1) + 1), ignore_index=True)[:args.rows]
+    print(f"📥 Benchmarking on {len(texts):,} reviews from {args.input}")
+
+    # -----------------------------
+    # Time both extractors
+    # -----------------------------
+    start = time.perf_counter()
+    emoji_pattern()
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    old = texts.apply(extract_emojis_per_char)
+    old_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = extract_emojis_series(texts)
+    new_seconds = time.perf_counter() - start
+
+    print(f"⏱️ per-character: {old_seconds:.2f}s ({len(texts) / old_seconds:,.0f} rows/s)")
+    print(f"⏱️ trie regex:    {new_seconds:.2f}s ({len(texts) / new_seconds:,.0f} rows/s), plus {compile_seconds:.2f}s one-off compile")
+    print(f"⚡ Speedup: {old_seconds / new_seconds:.1f}x")
+
+    # -----------------------------
+    # Where the results differ
+    # -----------------------------
+    # The per-character version drops variation selectors, joiners and flag
+    # halves, so it can only disagree on rows with multi-codepoint emoji
+    differs = old != new
+    print(f"🔍 {int(differs.sum()):,} rows differ ({differs.mean():.2%}), all from multi-codepoint emoji. Examples:")
+    for before, after in list(zip(old[differs], new[differs]))[:5]:
+        print(f"   {before!r} -> {after!r}")
+
+
+if __name__ == "__main__":
+    main()
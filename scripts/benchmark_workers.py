@@ -0,0 +1,55 @@
+import pandas as pd
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_engine import BatchSentimentScorer, MODEL_NAME
+from utils.storage import load_reviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure RoBERTa scoring throughput for different worker counts")
+    parser.add_argument("--input", default="data/zoom_with_hf_sentiment_sampled.parquet", help="Reviews with a `combined` or `content` column")
+    parser.add_argument("--rows", type=int, default=2000, help="Number of reviews to score per run")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to compare")
+    parser.add_argument("--batch-size", type=int, default=32, help="Reviews per model forward pass")
+    parser.add_argument("--model", default=MODEL_NAME, help="Model name or local model directory")
+    args = parser.parse_args()
+
+    # -----------------------------
+    # Load benchmark texts
+    # -----------------------------
+    texts = load_reviews(args.input, columns=["combined"])["combined"].tolist()
+    texts = (texts * (args.rows // max(len(texts), 1) + 1))[:args.rows]
+    print(f"📥 Benchmarking on {len(texts):,} reviews from {args.input} ({os.cpu_count()} CPU cores)")
+
+    # -----------------------------
+    # Time each worker count
+    # -----------------------------
+    # The cache and per-run dedupe are bypassed so every row hits the model
+    results = []
+    for workers in args.workers:
+        scorer = BatchSentimentScorer(args.model, batch_size=args.batch_size, workers=workers)
+        scorer.predict_texts(texts[:args.batch_size * workers * 4])  # warm up every worker's model
+        start = time.perf_counter()
+        scorer.predict_texts(texts)
+        elapsed = time.perf_counter() - start
+        scorer.close()
+        results.append({"workers": workers, "seconds": elapsed, "rows_per_sec": len(texts) / elapsed})
+        print(f"⏱️ {workers} worker(s): {elapsed:.1f}s ({len(texts) / elapsed:.1f} rows/s)")
+
+    # -----------------------------
+    # Scaling report
+    # -----------------------------
+    report = pd.DataFrame(results)
+    baseline = report["rows_per_sec"].iloc[0] / report["workers"].iloc[0]
+    report["speedup"] = report["rows_per_sec"] / baseline
+    report["efficiency"] = report["speedup"] / report["workers"]
+    print("\n📊 Scaling report (efficiency 1.00 = linear):")
+    print(report.to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.apps import APPS
+from utils.sentiment_cube import CUBE_PATH, build_cube
+from utils.storage import write_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the sentiment count cube from every app's scored sample")
+    parser.add_argument("--apps", nargs="+", choices=list(APPS), default=list(APPS), help="Apps to include (default: all)")
+    parser.add_argument("--output", default=CUBE_PATH, help="Cube location (.parquet, or .csv to export CSV)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cube = build_cube(args.apps)
+    write_dataset(cube, args.output)
+    print(f"✅ {len(cube):,} cells covering {int(cube['reviews'].sum()):,} reviews saved to: {args.output} "
+          f"({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import os
+import sys
+import time
+
+# Never reach out to the HuggingFace Hub during the check; read when transformers is imported
+os.environ["HF_HUB_OFFLINE"] = "1"
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_backends import BACKENDS
+from utils.sentiment_engine import BatchSentimentScorer, LABEL_MAP
+from utils.storage import load_reviews
+
+
+def model_size_mb(scorer):
+    # Serialized weights are a stable proxy for resident model memory
+    backend = scorer.backend
+    if hasattr(backend, "model"):
+        import io
+        import torch
+
+        buffer = io.BytesIO()
+        torch.save(backend.model.state_dict(), buffer)
+        return buffer.tell() / 1024 / 1024
+    # The exported file the ONNX session was loaded from
+    return os.path.getsize(backend.path) / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check label agreement of alternative backends against PyTorch")
+    parser.add_argument("--model", default="models/twitter-roberta-base-sentiment",
+                        help="Locally saved model directory (see scripts/save_model.py)")
+    parser.add_argument("--input", default="data/firefox_with_hf_sentiment_sampled.parquet", help="Held-out review file")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS[1:], default=BACKENDS[1:],
+                        help="Backends to compare with torch")
+    parser.add_argument("--batch-size", type=int, default=32, help="Reviews per model forward pass")
+    parser.add_argument("--min-agreement", type=float, default=0.99, help="Fail if agreement drops below this")
+    args = parser.parse_args()
+
+    texts = load_reviews(args.input, columns=["combined"])["combined"].tolist()
+    print(f"📥 Checking {len(texts):,} held-out reviews from {args.input}")
+
+    results = {}
+    for backend in ["torch"] + args.backends:
+        scorer = BatchSentimentScorer(args.model, batch_size=args.batch_size, backend=backend, local_files_only=True)
+        start = time.perf_counter()
+        probs = scorer.predict_texts(texts)
+        elapsed = time.perf_counter() - start
+        # Rows the backend failed on are NaN and stay unlabelled instead of becoming class 0
+        failed_rows = np.isnan(probs).any(axis=1)
+        labels = pd.Series([scorer.id2label[k] for k in np.nan_to_num(probs).argmax(axis=1)]).map(LABEL_MAP)
+        labels = labels.where(~failed_rows)
+        if failed_rows.any():
+            print(f"⚠️ {backend} could not score {failed_rows.sum():,} reviews; they are left out of the comparison")
+        results[backend] = {"labels": labels, "ms_per_review": elapsed / len(texts) * 1000,
+                            "model_mb": model_size_mb(scorer)}
+
+    reference = results["torch"]
+    print(f"\n{'backend':<10} {'agreement':>10} {'ms/review':>10} {'speedup':>8} {'model MB':>9}")
+    failed = False
+    for backend, result in results.items():
+        scored = result["labels"].notna() & reference["labels"].notna()
+        agreement = (result["labels"][scored] == reference["labels"][scored]).mean()
+        speedup = reference["ms_per_review"] / result["ms_per_review"]
+        print(f"{backend:<10} {agreement:>10.2%} {result['ms_per_review']:>10.2f} "
+              f"{speedup:>7.1f}x {result['model_mb']:>9.1f}")
+        failed |= agreement < args.min_agreement
+
+    for backend in args.backends:
+        print(f"\n🔍 torch vs {backend} confusion:")
+        print(pd.crosstab(reference["labels"], results[backend]["labels"], rownames=["torch"], colnames=[backend]))
+
+    if failed:
+        print(f"\n❌ At least one backend agrees with torch on fewer than {args.min_agreement:.0%} of labels")
+        sys.exit(1)
+    print("\n✅ All backends agree with torch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import time
+
+# Started before anything else so the Streamlit import counts as startup
+START = time.perf_counter()
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+# Modules the Home page must not pull in; they belong to the pages that plot or load data
+LAZY_MODULES = ["matplotlib", "seaborn", "plotly", "utils.storage"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the dashboard's cold start against the Home page budget")
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="Streamlit app to start")
+    parser.add_argument("--budget", type=float, default=1.5, help="Seconds allowed for a cold start of the Home page")
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+
+    # The app resolves data and figure paths from the repo root
+    os.chdir(ROOT)
+    imported = time.perf_counter()
+    app = AppTest.from_file(args.app, default_timeout=max(args.budget * 10, 30))
+    app.run()
+    finished = time.perf_counter()
+
+    if app.exception:
+        print(f"❌ Home page raised: {app.exception[0].value}")
+        sys.exit(1)
+
+    total = finished - START
+    print(f"⏱️ Streamlit import {imported - START:.2f}s, Home page run {finished - imported:.2f}s, "
+          f"total {total:.2f}s (budget {args.budget:.2f}s)")
+    loaded = [name for name in LAZY_MODULES if name in sys.modules]
+    if loaded:
+        print(f"⚠️ Home page imported modules meant for other pages: {', '.join(loaded)}")
+    if total > args.budget or loaded:
+        print("❌ Cold start is over budget")
+        sys.exit(1)
+    print("✅ Cold start within budget")
+
+
+if __name__ == "__main__":
+    main()
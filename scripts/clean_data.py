@@ -1,48 +1,20 @@
-import pandas as pd
-import re
-import emoji
+import argparse
 import os
+import sys
 
-# Create paths
-# Absolute path
-input_path = r"S:\Private\lvemula\ASN3\data\Zoom.xlsx"
-output_path = r"S:\Private\lvemula\ASN3\data\cleaned_zoom_reviews.csv"
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.cleaning import add_cleaning_args, clean_app
 
 
-# Load data
-df = pd.read_excel(input_path)
+def main():
+    # Paths and export quirks live in the app registry (utils/apps.py);
+    # scripts/clean_reviews.py cleans every app at once
+    parser = argparse.ArgumentParser(description="Clean the Zoom review export")
+    add_cleaning_args(parser)
+    args = parser.parse_args()
 
-# Drop irrelevant columns
-df = df.drop(columns=["userImage", "replyContent", "repliedAt"])
+    clean_app("zoom", fmt=args.format, chunked=args.chunked, chunk_size=args.chunk_size)
 
-# Drop rows with missing content or score
-df = df.dropna(subset=["content", "score"])
 
-# Normalize text: lowercase and strip whitespace
-df["content"] = df["content"].astype(str).str.lower().str.strip()
-
-# Extract emojis
-def extract_emojis(text):
-    return ''.join(c for c in text if c in emoji.EMOJI_DATA)
-
-df["emojis"] = df["content"].apply(extract_emojis)
-
-# Drop duplicates
-df = df.drop_duplicates(subset=["reviewId", "content"])
-
-# Step: Fill or Flag Missing Versions
-df["appVersion"] = df["appVersion"].fillna("unknown")
-df["reviewCreatedVersion"] = df["reviewCreatedVersion"].fillna("unknown")
-
-# Step: Convert 'at' (timestamp) to datetime
-df["at"] = pd.to_datetime(df["at"], errors='coerce')
-
-
-# Reset index
-df.reset_index(drop=True, inplace=True)
-
-# Save cleaned dataset
-df.to_csv(output_path, index=False)
-
-print("✅ Cleaned dataset saved to:", output_path)
-print("Final Shape:", df.shape)
+if __name__ == "__main__":
+    main()
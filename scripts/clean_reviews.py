@@ -0,0 +1,29 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.apps import APPS
+from utils.cleaning import add_cleaning_args, clean_apps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean the review exports of every registered app in parallel")
+    parser.add_argument("--apps", nargs="+", choices=list(APPS), default=list(APPS), help="Apps to clean (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Processes, one app each (default: CPU cores)")
+    add_cleaning_args(parser)
+    args = parser.parse_args()
+
+    print(f"📥 Cleaning {', '.join(APPS[key]['name'] for key in args.apps)}")
+    start = time.perf_counter()
+    results = clean_apps(args.apps, workers=args.workers, fmt=args.format, chunked=args.chunked,
+                         chunk_size=args.chunk_size)
+    wall = time.perf_counter() - start
+    slowest = max(result["seconds"] for result in results)
+    total = sum(result["seconds"] for result in results)
+    print(f"⏱️ Wall time {wall:.1f}s for {total:.1f}s of cleaning (largest app {slowest:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
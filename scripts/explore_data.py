@@ -3,12 +3,20 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import Counter
 from wordcloud import WordCloud
-import emoji
 from matplotlib import font_manager
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.emoji_utils import split_emojis
+from utils.storage import load_reviews
 
 # Load updated dataset
-df = pd.read_csv("data/cleaned_zoom_reviews.csv")
+# Only the columns the plots use are read from the Parquet file
+df = load_reviews("data/cleaned_zoom_reviews.parquet", columns=["at", "appVersion", "score", "content", "emojis"])
 df["at"] = pd.to_datetime(df["at"])
+if "unknown" not in df["appVersion"].cat.categories:
+    df["appVersion"] = df["appVersion"].cat.add_categories("unknown")
 df["appVersion"] = df["appVersion"].fillna("unknown")
 
 # Plot 1: Review count over time (monthly)
@@ -37,7 +45,8 @@ emoji_font = font_manager.FontProperties(fname=emoji_font_path)
 
 # Count top emojis
 emoji_series = df["emojis"].dropna()
-emoji_counter = Counter("".join(emoji_series))
+# Count whole emoji (skin tones, flags, ZWJ sequences) rather than code points
+emoji_counter = Counter(e for emojis in emoji_series for e in split_emojis(str(emojis)))
 top_emojis = emoji_counter.most_common(20)
 
 # Prepare data
@@ -1,101 +1,124 @@
-import pandas as pd
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
 import matplotlib.pyplot as plt
 import seaborn as sns
+import argparse
 import os
+import sys
 
-# -----------------------------
-# Step 1: Load and Sample Data
-# -----------------------------
-print("📥 Loading cleaned Firefox dataset...")
-df = pd.read_csv("data/cleaned_firefox_reviews.csv")
-df["at"] = pd.to_datetime(df["at"], errors="coerce")
-df = df.sort_values("at")
-
-# Sample 5,000 reviews across time (stratified by month)
-print("🔄 Sampling reviews across time...")
-sampled_df = df.groupby(df["at"].dt.to_period("M")).apply(
-    lambda x: x.sample(min(150, len(x)), random_state=42)
-).reset_index(drop=True)
-
-# Combine text + emojis
-sampled_df["combined"] = sampled_df["content"].astype(str) + " " + sampled_df["emojis"].fillna("")
-
-# -----------------------------
-# Step 2: Load HuggingFace Model
-# -----------------------------
-print("🤗 Loading HuggingFace RoBERTa model...")
-model_name = "cardiffnlp/twitter-roberta-base-sentiment"
-tokenizer = AutoTokenizer.from_pretrained(model_name)
-model = AutoModelForSequenceClassification.from_pretrained(model_name)
-sentiment_pipe = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
-
-# -----------------------------
-# Step 3: Run Sentiment Analysis
-# -----------------------------
-def classify_sentiment(text):
-    try:
-        result = sentiment_pipe(text[:512])[0]
-        return result["label"].lower()
-    except:
-        return "neutral"
-
-print("🧠 Running sentiment classification on sampled Firefox reviews...")
-sampled_df["hf_sentiment"] = sampled_df["combined"].apply(classify_sentiment)
-
-# -----------------------------
-# Step 4: Map Model Labels
-# -----------------------------
-label_map = {
-    "label_0": "negative",
-    "label_1": "neutral",
-    "label_2": "positive",
-    "neutral": "neutral"
-}
-sampled_df["hf_sentiment_label"] = sampled_df["hf_sentiment"].map(label_map)
-
-# -----------------------------
-# Step 5: Save Updated Data
-# -----------------------------
-os.makedirs("data", exist_ok=True)
-output_path = "data/firefox_with_hf_sentiment_sampled.csv"
-sampled_df.to_csv(output_path, index=False)
-print(f"✅ Sentiment data saved to: {output_path}")
-
-# -----------------------------
-# Step 6: Visualizations
-# -----------------------------
-print("📊 Creating sentiment visualizations for Firefox...")
-
-# Bar Chart
-plt.figure(figsize=(6, 4))
-sns.countplot(x="hf_sentiment_label", data=sampled_df, palette="Set2", order=["positive", "neutral", "negative"])
-plt.title("RoBERTa Sentiment Distribution (Firefox)")
-plt.xlabel("Sentiment")
-plt.ylabel("Count")
-plt.tight_layout()
-plt.savefig("output/figures/firefox_roberta_sentiment_bar.png")
-plt.close()
-
-# Pie Chart
-plt.figure(figsize=(6, 6))
-sampled_df["hf_sentiment_label"].value_counts().plot.pie(autopct="%1.1f%%", colors=["lightgreen", "lightgray", "salmon"])
-plt.title("RoBERTa Sentiment Proportion (Firefox)")
-plt.ylabel("")
-plt.tight_layout()
-plt.savefig("output/figures/firefox_roberta_sentiment_pie.png")
-plt.close()
-
-# Sentiment Over Time
-monthly_sentiment = sampled_df.groupby(sampled_df["at"].dt.to_period("M"))["hf_sentiment_label"].value_counts().unstack().fillna(0)
-monthly_sentiment.index = monthly_sentiment.index.to_timestamp()
-monthly_sentiment.plot(kind="line", figsize=(12, 6), marker="o")
-plt.title("Monthly RoBERTa Sentiment Trends (Firefox)")
-plt.xlabel("Month")
-plt.ylabel("Review Count")
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("output/figures/firefox_roberta_sentiment_over_time.png")
-plt.close()
-
-print("✅ All visualizations saved in: output/figures/firefox/")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.adaptive_sampling import adaptive_score, add_adaptive_args
+from utils.near_duplicates import add_near_duplicate_args, near_duplicate_clusters
+from utils.review_frame import combined_text
+from utils.sampling import add_sampling_args, sample_dataset
+from utils.scoring_cli import (
+    add_scoring_args, build_scorer, close_scorer, open_token_store, score_in_chunks, score_near_duplicates,
+)
+from utils.sentiment_cube import rollup, update_cube
+from utils.sentiment_engine import LABEL_MAP
+from utils.storage import add_format_arg, with_format, write_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score sampled Firefox reviews with RoBERTa")
+    add_scoring_args(parser)
+    add_format_arg(parser)
+    add_sampling_args(parser)
+    add_adaptive_args(parser)
+    add_near_duplicate_args(parser)
+    args = parser.parse_args()
+
+    # -----------------------------
+    # Step 1: Load and Sample Data
+    # -----------------------------
+    # Stratified reservoir sample (150 per month by default), streamed
+    print("📥 Sampling cleaned Firefox dataset...")
+    # In adaptive mode this is a larger candidate pool, scored only as far as needed
+    per_stratum = args.max_per_stratum if args.adaptive else args.per_stratum
+    sampled_df = sample_dataset("data/cleaned_firefox_reviews.parquet", args.strata, per_stratum,
+                                seed=args.seed, chunk_size=args.sample_chunk_size, keep_strata=args.adaptive)
+
+    # Combine text + emojis
+    sampled_df["combined"] = combined_text(sampled_df)
+
+    # -----------------------------
+    # Step 2: Load HuggingFace Model
+    # -----------------------------
+    print("🤗 Loading HuggingFace RoBERTa model...")
+    scorer = build_scorer(args)
+
+    # -----------------------------
+    # Step 3: Run Sentiment Analysis
+    # -----------------------------
+    print("🧠 Running sentiment classification on sampled Firefox reviews...")
+    if args.adaptive:
+        sampled_df, results, strata = adaptive_score(
+            sampled_df, scorer, target_width=args.ci_width, batch_per_stratum=args.round_size,
+            min_per_stratum=args.min_per_stratum,
+        )
+        print(strata.to_string())
+    elif args.near_dup_threshold:
+        sampled_df["cluster_id"] = near_duplicate_clusters(sampled_df["combined"], threshold=args.near_dup_threshold)
+        results = score_near_duplicates(sampled_df["combined"], sampled_df["cluster_id"], scorer, args, "firefox_roberta")
+    else:
+        token_store = open_token_store(args, scorer, sampled_df["combined"])
+        results = score_in_chunks(sampled_df["combined"], scorer, args, "firefox_roberta", token_store=token_store)
+    sampled_df["hf_sentiment"] = results["label"].values
+    # Rows the model could not score keep an empty label and the reason
+    sampled_df["hf_error"] = results["error"].values
+    close_scorer(scorer)
+
+    # -----------------------------
+    # Step 4: Map Model Labels
+    # -----------------------------
+    sampled_df["hf_sentiment_label"] = sampled_df["hf_sentiment"].map(LABEL_MAP)
+
+    # -----------------------------
+    # Step 5: Save Updated Data
+    # -----------------------------
+    os.makedirs("data", exist_ok=True)
+    output_path = with_format("data/firefox_with_hf_sentiment_sampled.parquet", args.format)
+    write_dataset(sampled_df, output_path)
+    print(f"✅ Sentiment data saved to: {output_path}")
+
+    # Refresh this app's counts in the sentiment cube used by the dashboard and trend plots
+    cube = update_cube("firefox", sampled_df)
+
+    # -----------------------------
+    # Step 6: Visualizations
+    # -----------------------------
+    print("📊 Creating sentiment visualizations for Firefox...")
+
+    # Bar Chart
+    plt.figure(figsize=(6, 4))
+    sns.countplot(x="hf_sentiment_label", data=sampled_df, palette="Set2", order=["positive", "neutral", "negative"])
+    plt.title("RoBERTa Sentiment Distribution (Firefox)")
+    plt.xlabel("Sentiment")
+    plt.ylabel("Count")
+    plt.tight_layout()
+    plt.savefig("output/figures/firefox_roberta_sentiment_bar.png")
+    plt.close()
+
+    # Pie Chart
+    plt.figure(figsize=(6, 6))
+    sampled_df["hf_sentiment_label"].value_counts().plot.pie(autopct="%1.1f%%", colors=["lightgreen", "lightgray", "salmon"])
+    plt.title("RoBERTa Sentiment Proportion (Firefox)")
+    plt.ylabel("")
+    plt.tight_layout()
+    plt.savefig("output/figures/firefox_roberta_sentiment_pie.png")
+    plt.close()
+
+    # Sentiment Over Time
+    monthly_sentiment = rollup(cube, ["month"], "hf_sentiment_label", app="firefox")
+    monthly_sentiment.plot(kind="line", figsize=(12, 6), marker="o")
+    plt.title("Monthly RoBERTa Sentiment Trends (Firefox)")
+    plt.xlabel("Month")
+    plt.ylabel("Review Count")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig("output/figures/firefox_roberta_sentiment_over_time.png")
+    plt.close()
+
+    print("✅ All visualizations saved in: output/figures/firefox/")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,20 @@
-import pandas as pd
-import emoji
+import argparse
 import os
+import sys
 
-# File paths
-input_path = "data/Firefox - Sheet1.csv"
-output_path = "data/cleaned_firefox_reviews.csv"
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.cleaning import add_cleaning_args, clean_app
 
-# Load data
-df = pd.read_csv(input_path)
 
-# Drop irrelevant columns
-df = df.drop(columns=["userImage", "replyContent", "repliedAt"])
+def main():
+    # Paths and export quirks live in the app registry (utils/apps.py);
+    # scripts/clean_reviews.py cleans every app at once
+    parser = argparse.ArgumentParser(description="Clean the Firefox review export")
+    add_cleaning_args(parser)
+    args = parser.parse_args()
 
-# Drop rows with missing content or score
-df = df.dropna(subset=["content", "score"])
+    clean_app("firefox", fmt=args.format, chunked=args.chunked, chunk_size=args.chunk_size)
 
-# Normalize text: lowercase and strip whitespace
-df["content"] = df["content"].astype(str).str.lower().str.strip()
 
-# Extract emojis
-def extract_emojis(text):
-    return ''.join(c for c in text if c in emoji.EMOJI_DATA)
-
-df["emojis"] = df["content"].apply(extract_emojis)
-
-# Fill or flag missing versions
-df["appVersion"] = df["appVersion"].fillna("unknown")
-df["reviewCreatedVersion"] = df["reviewCreatedVersion"].fillna("unknown")
-
-# Drop duplicates
-df = df.drop_duplicates(subset=["reviewId", "content"])
-
-# Convert 'at' (timestamp) to datetime
-df["at"] = pd.to_datetime(df["at"], errors='coerce')
-
-# Save cleaned dataset
-os.makedirs("data", exist_ok=True)
-df.to_csv(output_path, index=False)
-
-print(f"✅ Cleaned data saved at: {output_path}")
-print(f"Final Shape: {df.shape}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.emoji_sentiment import MODES
+from utils.incremental import ReviewIndex, default_index_path, incremental_update
+from utils.multi_scorer import SCORERS, build_scorers, close_scorers
+from utils.scoring_cli import add_scoring_args
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean and score only the reviews that are new or edited since the last run")
+    parser.add_argument("--input", default="data/Zoom.xlsx", help="Latest raw review export (CSV or XLSX)")
+    parser.add_argument("--cleaned-output", default="data/cleaned_zoom_reviews.parquet", help="Cleaned reviews to merge into (Parquet or CSV)")
+    parser.add_argument("--scored-output", default="data/zoom_with_all_sentiment.parquet", help="Scored reviews to merge into (Parquet or CSV)")
+    parser.add_argument("--index-path", default=None,
+                        help="SQLite index of processed reviewIds (default: data/cache/<cleaned output>_index.sqlite)")
+    parser.add_argument("--scorers", nargs="+", choices=SCORERS, default=SCORERS, help="Scorers to run")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Export rows read per chunk")
+    parser.add_argument("--emoji-mode", choices=MODES, default="first", help="Emoji sentiment by first lexicon match or majority vote")
+    parser.add_argument("--vader-workers", type=int, default=1, help="Processes for VADER scoring")
+    add_scoring_args(parser, checkpoints=False)
+    args = parser.parse_args()
+
+    index_path = args.index_path or default_index_path(args.cleaned_output)
+    index = ReviewIndex(index_path)
+    print(f"📥 Checking {args.input} against {len(index):,} indexed reviews in {index_path}")
+
+    scorers, roberta = build_scorers(args)
+    try:
+        incremental_update(args.input, args.cleaned_output, args.scored_output, scorers, index, chunk_size=args.chunk_size)
+    finally:
+        close_scorers(scorers, roberta)
+        index.close()
+    print(f"✅ Outputs up to date: {args.cleaned_output}, {args.scored_output}")
+
+
+if __name__ == "__main__":
+    main()
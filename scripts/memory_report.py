@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.review_frame import CATEGORY_COLUMNS, combined_text, memory_report
+from utils.storage import load_reviews, read_dataset, resolve_path
+
+DEFAULT_INPUTS = [
+    "data/cleaned_zoom_reviews.parquet",
+    "data/zoom_with_hf_sentiment_sampled.parquet",
+    "data/webex_with_hf_sentiment_sampled.parquet",
+    "data/firefox_with_hf_sentiment_sampled.parquet",
+]
+
+
+def load_uncompacted(path):
+    """The frame as the scripts used to hold it: object strings, int64 counts and a stored `combined`."""
+    df = read_dataset(path)
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(object)
+    for column in ["score", "thumbsUpCount"]:
+        if column in df.columns:
+            df[column] = df[column].astype("float64" if df[column].isna().any() else "int64")
+    if "content" in df.columns and "emojis" in df.columns:
+        df["combined"] = combined_text(df)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare review frame memory before and after the compact schema")
+    parser.add_argument("inputs", nargs="*", default=DEFAULT_INPUTS, help="Parquet or CSV datasets to measure")
+    args = parser.parse_args()
+
+    for path in args.inputs:
+        if not os.path.exists(resolve_path(path)):
+            print(f"⚠️ Skipping {path}: not found")
+            continue
+        before = load_uncompacted(path)
+        after = load_reviews(path)
+        report = memory_report({"before_mb": before, "after_mb": after})
+        saved = 1 - report.loc["TOTAL", "after_mb"] / report.loc["TOTAL", "before_mb"]
+
+        print(f"\n🧮 {path} ({len(after):,} rows)")
+        print(report.round(2).fillna("-").to_string())
+        print(f"✅ {report.loc['TOTAL', 'before_mb']:.1f} MB → {report.loc['TOTAL', 'after_mb']:.1f} MB ({saved:.0%} smaller)")
+        print("   dtypes: " + ", ".join(f"{column}={dtype}" for column, dtype in after.dtypes.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import argparse
+import os
+import sys
+
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_engine import MODEL_NAME
+
+# Download the sentiment model once so scoring can run fully offline afterwards
+parser = argparse.ArgumentParser(description="Save the RoBERTa sentiment model to a local directory")
+parser.add_argument("--model", default=MODEL_NAME, help="HuggingFace model name")
+parser.add_argument("--revision", default="main", help="Model revision to pin")
+parser.add_argument("--output", default="models/twitter-roberta-base-sentiment", help="Target directory")
+args = parser.parse_args()
+
+tokenizer = AutoTokenizer.from_pretrained(args.model, revision=args.revision)
+model = AutoModelForSequenceClassification.from_pretrained(args.model, revision=args.revision)
+os.makedirs(args.output, exist_ok=True)
+tokenizer.save_pretrained(args.output)
+model.save_pretrained(args.output)
+
+print(f"✅ Model saved to: {args.output}")
+print(f"Use it offline with: --model {args.output} --offline")
@@ -0,0 +1,34 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.emoji_sentiment import MODES
+from utils.multi_scorer import SCORERS, build_scorers, close_scorers, score_dataset
+from utils.scoring_cli import add_scoring_args
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run VADER, RoBERTa and emoji sentiment in a single pass")
+    parser.add_argument("--input", default="data/cleaned_zoom_reviews.parquet", help="Cleaned reviews (Parquet or CSV)")
+    parser.add_argument("--output", default="data/zoom_with_all_sentiment.parquet", help="Output with every sentiment column (.parquet, or .csv to export CSV)")
+    parser.add_argument("--scorers", nargs="+", choices=SCORERS, default=SCORERS, help="Scorers to run")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows read from disk per chunk")
+    parser.add_argument("--queue-depth", type=int, default=4, help="Chunks buffered between read, score and write")
+    parser.add_argument("--emoji-mode", choices=MODES, default="first", help="Emoji sentiment by first lexicon match or majority vote")
+    parser.add_argument("--vader-workers", type=int, default=1, help="Processes for VADER scoring")
+    add_scoring_args(parser, checkpoints=False)
+    args = parser.parse_args()
+
+    scorers, roberta = build_scorers(args)
+
+    print(f"📥 Scoring {args.input} with: {', '.join(args.scorers)}")
+    try:
+        score_dataset(args.input, args.output, scorers, chunk_size=args.chunk_size, queue_depth=args.queue_depth)
+    finally:
+        close_scorers(scorers, roberta)
+    print(f"✅ Sentiment data saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
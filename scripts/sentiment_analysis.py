@@ -1,75 +1,75 @@
 import pandas as pd
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import emoji
-from collections import Counter
 import matplotlib.pyplot as plt
 import seaborn as sns
+import argparse
 import os
+import sys
 
-# Prepare output folder
-os.makedirs("output/figures", exist_ok=True)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.emoji_sentiment import score_emoji_sentiment
+from utils.storage import add_format_arg, read_dataset, with_format, write_dataset
+from utils.vader_scoring import VaderEngine, default_workers, label_scores
 
-# Load cleaned dataset
-df = pd.read_csv("data/cleaned_zoom_reviews.csv")
-df["at"] = pd.to_datetime(df["at"])
 
-# --- Sentiment Analysis Using VADER ---
-analyzer = SentimentIntensityAnalyzer()
+def main():
+    parser = argparse.ArgumentParser(description="VADER sentiment and emoji polarity for the full Zoom corpus")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="Processes for VADER scoring")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Distinct reviews sent to a worker at a time")
+    add_format_arg(parser)
+    args = parser.parse_args()
 
-df["sentiment_score"] = df["content"].apply(lambda x: analyzer.polarity_scores(str(x))["compound"])
-df["sentiment_label"] = df["sentiment_score"].apply(
-    lambda score: "positive" if score >= 0.05 else "negative" if score <= -0.05 else "neutral"
-)
+    # Prepare output folder
+    os.makedirs("output/figures", exist_ok=True)
 
-# --- Emoji Polarity Mapping ---
-positive_emojis = set("😊😍😁😃😄👍🔥🥰✨❤️🤩")
-negative_emojis = set("😡😠😢😭👎😞💔🤬😣")
+    # Load cleaned dataset
+    df = read_dataset("data/cleaned_zoom_reviews.parquet")
 
-def emoji_sentiment(emojis):
-    if pd.isna(emojis) or not emojis.strip():
-        return "neutral"
-    pos = sum(1 for e in emojis if e in positive_emojis)
-    neg = sum(1 for e in emojis if e in negative_emojis)
-    if pos > neg:
-        return "positive"
-    elif neg > pos:
-        return "negative"
-    else:
-        return "neutral"
+    # --- Sentiment Analysis Using VADER ---
+    # Distinct texts are spread over a process pool; labels use vectorized thresholds
+    engine = VaderEngine(workers=args.workers, chunk_size=args.chunk_size)
+    df["sentiment_score"] = engine.compound(df["content"])
+    df["sentiment_label"] = label_scores(df["sentiment_score"])
+    engine.close()
 
-df["emoji_sentiment"] = df["emojis"].apply(emoji_sentiment)
+    # --- Emoji Polarity ---
+    # Majority vote of positive vs negative emoji from the shared lexicon
+    df["emoji_sentiment"] = score_emoji_sentiment(df["emojis"], mode="majority")
 
-# Save updated dataset
-df.to_csv("data/zoom_with_sentiment.csv", index=False)
+    # Save updated dataset
+    write_dataset(df, with_format("data/zoom_with_sentiment.parquet", args.format))
 
-# --- Visualizations ---
+    # --- Visualizations ---
 
-# Sentiment over time
-sentiment_trend = df.groupby(df["at"].dt.to_period("M"))["sentiment_score"].mean()
+    # Sentiment over time
+    sentiment_trend = df.groupby(df["at"].dt.to_period("M"))["sentiment_score"].mean()
 
-plt.figure(figsize=(12, 6))
-sentiment_trend.plot()
-plt.title("Average Sentiment Over Time")
-plt.ylabel("Sentiment Score")
-plt.xlabel("Month")
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("output/figures/sentiment_over_time.png")
-plt.show()
+    plt.figure(figsize=(12, 6))
+    sentiment_trend.plot()
+    plt.title("Average Sentiment Over Time")
+    plt.ylabel("Sentiment Score")
+    plt.xlabel("Month")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig("output/figures/sentiment_over_time.png")
+    plt.show()
 
-# Emoji Sentiment Pie
-plt.figure(figsize=(6, 6))
-df["emoji_sentiment"].value_counts().plot.pie(autopct="%1.1f%%", colors=["lightgreen", "lightcoral", "lightgrey"])
-plt.title("Emoji Sentiment Distribution")
-plt.ylabel("")
-plt.tight_layout()
-plt.savefig("output/figures/emoji_sentiment_pie.png")
-plt.show()
+    # Emoji Sentiment Pie
+    plt.figure(figsize=(6, 6))
+    df["emoji_sentiment"].value_counts().plot.pie(autopct="%1.1f%%", colors=["lightgreen", "lightcoral", "lightgrey"])
+    plt.title("Emoji Sentiment Distribution")
+    plt.ylabel("")
+    plt.tight_layout()
+    plt.savefig("output/figures/emoji_sentiment_pie.png")
+    plt.show()
 
-# Sentiment vs Emoji Polarity Heatmap (optional)
-heatmap_data = pd.crosstab(df["sentiment_label"], df["emoji_sentiment"])
-sns.heatmap(heatmap_data, annot=True, cmap="coolwarm")
-plt.title("Text Sentiment vs Emoji Polarity")
-plt.tight_layout()
-plt.savefig("output/figures/sentiment_vs_emoji_heatmap.png")
-plt.show()
+    # Sentiment vs Emoji Polarity Heatmap (optional)
+    heatmap_data = pd.crosstab(df["sentiment_label"], df["emoji_sentiment"])
+    sns.heatmap(heatmap_data, annot=True, cmap="coolwarm")
+    plt.title("Text Sentiment vs Emoji Polarity")
+    plt.tight_layout()
+    plt.savefig("output/figures/sentiment_vs_emoji_heatmap.png")
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
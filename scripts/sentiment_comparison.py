@@ -1,26 +1,21 @@
 import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import os
+import sys
 
-# Load datasets
-zoom_df = pd.read_csv("data/zoom_with_hf_sentiment_sampled.csv")
-webex_df = pd.read_csv("data/webex_with_hf_sentiment_sampled.csv")
-firefox_df = pd.read_csv("data/firefox_with_hf_sentiment_sampled.csv")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.apps import APPS
+from utils.sentiment_cube import load_or_build_cube, rollup
 
-# Combine all three datasets for plotting
-zoom_df["app"] = "Zoom"
-webex_df["app"] = "Webex"
-firefox_df["app"] = "Firefox"
-
-# Concatenate all three datasets
-combined_df = pd.concat([zoom_df, webex_df, firefox_df])
+# Sentiment counts per app, from the precomputed cube
+counts = rollup(load_or_build_cube(), ["hf_sentiment_label"], "app")
+counts = counts.rename(columns={key: app["name"] for key, app in APPS.items()})
 
 # Plot sentiment distribution comparison across apps
-plt.figure(figsize=(12, 6))
-sns.countplot(x="hf_sentiment_label", hue="app", data=combined_df, palette="Set2")
+counts.plot(kind="bar", figsize=(12, 6), color=plt.get_cmap("Set2").colors[:len(counts.columns)], rot=0)
 plt.title("Sentiment Distribution Comparison (Zoom, Webex, Firefox)")
 plt.xlabel("Sentiment")
 plt.ylabel("Count")
+plt.legend(title="app")
 plt.tight_layout()
 plt.savefig("output/figures/sentiment_comparison_all_apps.png")
 plt.close()
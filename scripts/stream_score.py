@@ -0,0 +1,31 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.scoring_cli import add_scoring_args, build_scorer, close_scorer
+from utils.streaming import stream_score_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a full cleaned review export through RoBERTa scoring")
+    parser.add_argument("--input", default="data/cleaned_zoom_reviews.parquet", help="Cleaned reviews (Parquet or CSV)")
+    parser.add_argument("--output", default="data/zoom_with_hf_sentiment.parquet", help="Scored output (.parquet, or .csv to export CSV)")
+    parser.add_argument("--text-column", default="combined", help="Column to score (built from content + emojis if missing)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows read from disk per chunk")
+    parser.add_argument("--queue-depth", type=int, default=4, help="Chunks buffered between pipeline stages")
+    add_scoring_args(parser, checkpoints=False)
+    args = parser.parse_args()
+
+    print(f"📥 Streaming {args.input} through the scoring pipeline...")
+    scorer = build_scorer(args)
+    try:
+        stream_score_dataset(args.input, args.output, scorer, text_column=args.text_column,
+                         chunk_size=args.chunk_size, queue_depth=args.queue_depth)
+    finally:
+        close_scorer(scorer)
+    print(f"✅ Scored reviews saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
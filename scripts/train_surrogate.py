@@ -0,0 +1,97 @@
+import pandas as pd
+import argparse
+import os
+import sys
+import time
+
+from sklearn.metrics import classification_report
+from sklearn.model_selection import train_test_split
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.apps import APPS
+from utils.inference_cache import normalize_text
+from utils.sentiment_engine import LABEL_MAP, MODEL_NAME
+from utils.storage import load_reviews, resolve_path
+from utils.surrogate import DEFAULT_SURROGATE_PATH, RAW_LABELS, SurrogateScorer, build_surrogate, save_surrogate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distil RoBERTa labels into a fast surrogate sentiment model")
+    parser.add_argument("--inputs", nargs="+", default=[APPS[key]["sampled"] for key in APPS],
+                        help="RoBERTa-labelled review files (default: every app's scored sample)")
+    parser.add_argument("--output", default=DEFAULT_SURROGATE_PATH, help="Where to save the surrogate")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Held-out share used for the agreement report")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the train/test split")
+    parser.add_argument("--compare-transformer", action="store_true",
+                        help="Also time RoBERTa on the held-out reviews to report the speedup")
+    parser.add_argument("--model", default=MODEL_NAME, help="RoBERTa model name or local directory for the comparison")
+    args = parser.parse_args()
+
+    # -----------------------------
+    # Step 1: Load RoBERTa-labelled reviews
+    # -----------------------------
+    # Each sample may still be a CSV if it has not been migrated to Parquet
+    paths = [resolve_path(path) for path in args.inputs]
+    missing = [path for path in paths if not os.path.exists(path)]
+    for path in missing:
+        print(f"⚠️ Skipping {path}: not found")
+    paths = [path for path in paths if path not in missing]
+    if not paths:
+        print("❌ No RoBERTa-labelled review files found; score the samples first or pass --inputs")
+        sys.exit(1)
+
+    frames = []
+    for path in paths:
+        df = load_reviews(path, columns=["combined", "hf_sentiment_label"])
+        df["app"] = os.path.basename(path).split("_")[0]
+        frames.append(df[["app", "combined", "hf_sentiment_label"]])
+    df = pd.concat(frames, ignore_index=True).dropna(subset=["hf_sentiment_label"])
+    df["text"] = df["combined"].fillna("").map(normalize_text)
+    df["target"] = df["hf_sentiment_label"].map(RAW_LABELS)
+    print(f"📥 Loaded {len(df):,} labelled reviews from {len(paths)} file(s)")
+
+    train_df, test_df = train_test_split(df, test_size=args.test_size, random_state=args.seed,
+                                         stratify=df["target"])
+
+    # -----------------------------
+    # Step 2: Fit and save the surrogate
+    # -----------------------------
+    print(f"🏋️ Training surrogate on {len(train_df):,} reviews...")
+    model = build_surrogate()
+    model.fit(train_df["text"], train_df["target"])
+    save_surrogate(model, args.output, trained_on=paths, rows=len(train_df))
+    print(f"✅ Surrogate saved to: {args.output}")
+
+    # -----------------------------
+    # Step 3: Agreement report against hf_sentiment_label
+    # -----------------------------
+    scorer = SurrogateScorer(args.output)
+    start = time.perf_counter()
+    predicted = scorer.predict_texts(test_df["text"].tolist()).argmax(axis=1)
+    surrogate_seconds = time.perf_counter() - start
+    test_df = test_df.assign(surrogate_label=[LABEL_MAP[scorer.id2label[k]] for k in predicted])
+    test_df["agreement"] = test_df["surrogate_label"] == test_df["hf_sentiment_label"]
+
+    print(f"\n🤝 Agreement with hf_sentiment_label on {len(test_df):,} held-out reviews: "
+          f"{test_df['agreement'].mean():.1%}")
+    print(test_df.groupby("app")["agreement"].mean().to_string(float_format=lambda x: f"{x:.1%}"))
+    print("\n🔍 Confusion (rows: RoBERTa, columns: surrogate):")
+    print(pd.crosstab(test_df["hf_sentiment_label"], test_df["surrogate_label"],
+                      rownames=["roberta"], colnames=["surrogate"]))
+    print()
+    print(classification_report(test_df["hf_sentiment_label"], test_df["surrogate_label"], digits=3))
+
+    surrogate_rate = len(test_df) / max(surrogate_seconds, 1e-9)
+    print(f"⚡ Surrogate: {surrogate_rate:,.0f} reviews/s")
+    if args.compare_transformer:
+        from utils.sentiment_engine import BatchSentimentScorer
+
+        roberta = BatchSentimentScorer(args.model)
+        start = time.perf_counter()
+        roberta.predict_texts(test_df["text"].tolist())
+        roberta_rate = len(test_df) / (time.perf_counter() - start)
+        print(f"⚡ RoBERTa:   {roberta_rate:,.0f} reviews/s → surrogate is {surrogate_rate / roberta_rate:,.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from utils.sentiment_engine import LABEL_MAP
+
+SENTIMENTS = ["negative", "neutral", "positive"]
+
+
+def wilson_width(successes, n, z=1.96):
+    """Width of the Wilson score interval for a proportion, elementwise; 1.0 where n is 0."""
+    successes = np.asarray(successes, dtype=float)
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / n
+        half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / (1 + z ** 2 / n)
+    return np.where(n > 0, 2 * half, 1.0)
+
+
+def strata_summary(scored, labels, pool_sizes, target_width, min_per_stratum, z=1.96):
+    """Per-stratum sample size, sentiment proportions, widest interval and whether it has converged."""
+    counts = pd.crosstab(scored["stratum"], labels).reindex(index=pool_sizes.index, columns=SENTIMENTS, fill_value=0)
+    n = counts.sum(axis=1)
+    summary = counts.div(n.replace(0, np.nan), axis=0).round(3).rename_axis(columns=None)
+    summary.insert(0, "scored", scored["stratum"].value_counts().reindex(pool_sizes.index, fill_value=0))
+    summary["ci_width"] = wilson_width(counts, n.to_numpy()[:, None], z=z).max(axis=1).round(3)
+    summary["converged"] = (n >= min_per_stratum) & (summary["ci_width"] <= target_width)
+    summary["exhausted"] = summary["scored"] >= pool_sizes
+    return summary
+
+
+def adaptive_score(candidates, scorer, text_column="combined", target_width=0.2, batch_per_stratum=25,
+                   min_per_stratum=30, z=1.96):
+    """Score strata in random order until each one's sentiment estimates are precise enough.
+
+    `candidates` comes from sample_dataset(..., keep_strata=True). Every
+    round scores the next `batch_per_stratum` draws of all strata that are
+    still open, in one scorer call, then closes a stratum once it has at
+    least `min_per_stratum` scored reviews and the Wilson interval of every
+    sentiment proportion is at most `target_width` wide, or once its pool
+    runs out. Returns the scored rows (in date order, without the sampling
+    columns), their results frame and the per-stratum summary.
+    """
+    pool_sizes = candidates["stratum"].value_counts().sort_index()
+    scored_upto = pd.Series(0, index=pool_sizes.index)
+    open_strata = pd.Series(True, index=pool_sizes.index)
+    frames, results = [], []
+    rounds = 0
+    while open_strata.any():
+        rounds += 1
+        limit = scored_upto + batch_per_stratum * open_strata
+        draw_limit = candidates["stratum"].map(limit)
+        batch = candidates[(candidates["draw"] >= candidates["stratum"].map(scored_upto)) & (candidates["draw"] < draw_limit)]
+        scored_upto = limit.clip(upper=pool_sizes)
+        frames.append(batch)
+        results.append(scorer.score(batch[text_column]))
+
+        scored = pd.concat(frames)
+        labels = pd.concat(results, ignore_index=True)["label"].map(LABEL_MAP).to_numpy()
+        summary = strata_summary(scored, pd.Series(labels, index=scored.index, name="label"), pool_sizes,
+                                 target_width, min_per_stratum, z=z)
+        open_strata = ~(summary["converged"] | summary["exhausted"])
+        print(f"🎯 Round {rounds}: {len(scored):,} reviews scored, "
+              f"{int(summary['converged'].sum()):,}/{len(summary):,} strata converged, {int(open_strata.sum()):,} open")
+
+    scored = pd.concat(frames)
+    results = pd.concat(results, ignore_index=True)
+    order = np.argsort(pd.to_datetime(scored["at"], errors="coerce").to_numpy(), kind="stable")
+    scored = scored.iloc[order].drop(columns=["stratum", "draw"]).reset_index(drop=True)
+    results = results.iloc[order].reset_index(drop=True)
+    return scored, results, summary
+
+
+def add_adaptive_args(parser):
+    """Register the adaptive scoring options shared by the sentiment scripts."""
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Score each stratum only until its sentiment proportions are precise enough")
+    parser.add_argument("--ci-width", type=float, default=0.2,
+                        help="Stop a stratum once every 95%% interval on its sentiment shares is this narrow")
+    parser.add_argument("--max-per-stratum", type=int, default=1000,
+                        help="Candidate reviews drawn per stratum in adaptive mode")
+    parser.add_argument("--min-per-stratum", type=int, default=30, help="Reviews scored per stratum before stopping")
+    parser.add_argument("--round-size", type=int, default=25, help="Reviews scored per open stratum each round")
+    return parser
@@ -0,0 +1,41 @@
+# Every app the pipeline knows about. Onboarding an app is one entry here:
+#   name      display name used in plots and messages
+#   source    raw review export, relative to the repo root
+#   format    "csv" or "xlsx"
+#   rename    export column -> pipeline column, for exports whose headers differ
+#   cleaned   cleaned dataset written by scripts/clean_reviews.py
+#   sampled   RoBERTa-scored sample shown in the dashboard
+APPS = {
+    "zoom": {
+        "name": "Zoom",
+        "source": "data/Zoom.xlsx",
+        "format": "xlsx",
+        "rename": {},
+        "cleaned": "data/cleaned_zoom_reviews.parquet",
+        "sampled": "data/zoom_with_hf_sentiment_sampled.parquet",
+    },
+    "webex": {
+        "name": "Webex",
+        "source": "data/Webex - Sheet1.csv",
+        "format": "csv",
+        "rename": {},
+        "cleaned": "data/cleaned_webex_reviews.parquet",
+        "sampled": "data/webex_with_hf_sentiment_sampled.parquet",
+    },
+    "firefox": {
+        "name": "Firefox",
+        "source": "data/Firefox - Sheet1.csv",
+        "format": "csv",
+        "rename": {},
+        "cleaned": "data/cleaned_firefox_reviews.parquet",
+        "sampled": "data/firefox_with_hf_sentiment_sampled.parquet",
+    },
+}
+
+
+def get_app(key):
+    """Registry entry for `key`, with a readable error for unknown apps."""
+    if key not in APPS:
+        raise ValueError(f"Unknown app {key!r}, expected one of {list(APPS)}")
+    return APPS[key]
+
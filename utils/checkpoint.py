@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+
+def fingerprint_texts(texts, *extra):
+    """Hash the input texts (plus e.g. model name) so a resume never mixes different runs."""
+    digest = hashlib.sha1("\0".join(str(part) for part in extra).encode("utf-8"))
+    for text in texts:
+        digest.update(str(text).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def count_csv_rows(path):
+    """Approximate data rows in a CSV by counting lines (quoted newlines overcount slightly)."""
+    with open(path, "rb") as f:
+        lines = sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+    return max(lines - 1, 0)
+
+
+def _format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressMeter:
+    """Progress and ETA readout based on throughput measured in this session."""
+
+    def __init__(self, total, done=0, label="rows"):
+        self.total = total
+        self.done = done
+        self.label = label
+        self.session_rows = 0
+        self.start = time.perf_counter()
+
+    def update(self, rows):
+        self.done += rows
+        self.session_rows += rows
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        rate = self.session_rows / elapsed
+        remaining = (self.total - self.done) / rate if rate else float("inf")
+        percent = self.done / self.total * 100 if self.total else 100.0
+        print(f"⏳ {self.done:,}/{self.total:,} {self.label} ({percent:.1f}%) · "
+              f"{rate:.1f} {self.label}/s · ETA {_format_duration(remaining)}")
+
+
+class ScoringCheckpoint:
+    """Append-only scored chunks plus a manifest of completed row ranges.
+
+    Each finished chunk is written to its own part file and only then recorded
+    in `manifest.json`, so a run killed mid-chunk loses at most that chunk.
+    With `resume=True` the completed ranges are skipped; otherwise any previous
+    checkpoint in the directory is discarded.
+    """
+
+    def __init__(self, directory, total_rows, fingerprint, chunk_size, resume=False):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        os.makedirs(directory, exist_ok=True)
+
+        manifest = None
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+
+        if resume and manifest is not None:
+            if manifest["fingerprint"] != fingerprint or manifest["total_rows"] != total_rows:
+                raise ValueError(f"Checkpoint in {directory} was written for different input; "
+                                 f"rerun without --resume to start over")
+            self.manifest = manifest
+            if manifest["chunk_size"] != chunk_size:
+                print(f"ℹ️ Keeping the checkpoint's chunk size of {manifest['chunk_size']:,} rows")
+            print(f"🔁 Resuming: {self.rows_done():,}/{total_rows:,} rows already scored")
+        else:
+            if manifest is not None:
+                for chunk in manifest["chunks"]:
+                    part = os.path.join(directory, chunk["file"])
+                    if os.path.exists(part):
+                        os.remove(part)
+            self.manifest = {"fingerprint": fingerprint, "total_rows": total_rows,
+                             "chunk_size": chunk_size, "chunks": []}
+            self._save_manifest()
+
+    def _save_manifest(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def rows_done(self):
+        return sum(chunk["end"] - chunk["start"] for chunk in self.manifest["chunks"])
+
+    def pending(self):
+        """Yield the (start, end) row ranges that still need scoring."""
+        chunk_size = self.manifest["chunk_size"]
+        done = {(chunk["start"], chunk["end"]) for chunk in self.manifest["chunks"]}
+        for start in range(0, self.manifest["total_rows"], chunk_size):
+            end = min(start + chunk_size, self.manifest["total_rows"])
+            if (start, end) not in done:
+                yield start, end
+
+    def write_chunk(self, start, end, frame):
+        file_name = f"part-{start:09d}-{end:09d}.csv"
+        tmp_path = os.path.join(self.directory, file_name + ".tmp")
+        frame.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, os.path.join(self.directory, file_name))
+        self.manifest["chunks"].append({"start": start, "end": end, "file": file_name})
+        self._save_manifest()
+
+    def load(self):
+        """Concatenate every completed chunk in row order."""
+        chunks = sorted(self.manifest["chunks"], key=lambda chunk: chunk["start"])
+        parts = [pd.read_csv(os.path.join(self.directory, chunk["file"])) for chunk in chunks]
+        return pd.concat(parts, ignore_index=True)
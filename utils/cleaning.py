@@ -0,0 +1,196 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from utils.apps import get_app
+from utils.emoji_utils import extract_emojis_series
+from utils.storage import DatasetWriter, add_format_arg, with_format, write_dataset
+
+# Columns the cleaners never use
+DROP_COLUMNS = ["userImage", "replyContent", "repliedAt"]
+DEDUPE_COLUMNS = ["reviewId", "content"]
+
+
+def clean_chunk(df):
+    """Apply every per-row cleaning step (everything except deduplication)."""
+    df = df.drop(columns=[column for column in DROP_COLUMNS if column in df.columns])
+
+    # Drop rows with missing content or score
+    df = df.dropna(subset=["content", "score"])
+
+    # Normalize text: lowercase and strip whitespace
+    df["content"] = df["content"].astype(str).str.lower().str.strip()
+
+    # Extract emojis
+    df["emojis"] = extract_emojis_series(df["content"])
+
+    # Fill or flag missing versions
+    df["appVersion"] = df["appVersion"].fillna("unknown")
+    df["reviewCreatedVersion"] = df["reviewCreatedVersion"].fillna("unknown")
+
+    # Convert 'at' (timestamp) to datetime
+    df["at"] = pd.to_datetime(df["at"], errors='coerce')
+    return df
+
+
+def clean_frame(df):
+    """Clean a fully loaded export, as the original per-app scripts did."""
+    df = clean_chunk(df)
+    df = df.drop_duplicates(subset=DEDUPE_COLUMNS)
+    return df.reset_index(drop=True)
+
+
+class SeenSet:
+    """Compact record of (reviewId, content) pairs already written.
+
+    Pairs are stored as 64-bit hashes (8 bytes per review) instead of Python
+    tuples, in a few sorted runs: each chunk's new hashes start a small run,
+    and runs are merged once the newer one has grown to half the size of
+    the one before it. No chunk copies the whole set, so deduplication
+    stays close to linear in the export size, and a lookup only searches
+    a logarithmic number of runs.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def _seen(self, hashes):
+        seen = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            seen |= run[positions] == hashes
+        return seen
+
+    def keep_new(self, df):
+        """Boolean mask of rows whose pair has not been seen before; records them as seen."""
+        hashes = pd.util.hash_pandas_object(df[DEDUPE_COLUMNS].astype(str), index=False).to_numpy()
+        keep = ~self._seen(hashes) & ~pd.Series(hashes).duplicated().to_numpy()
+        if keep.any():
+            self.runs.append(np.sort(hashes[keep]))
+            while len(self.runs) > 1 and 2 * len(self.runs[-1]) >= len(self.runs[-2]):
+                newer = self.runs.pop()
+                self.runs[-1] = np.sort(np.concatenate([self.runs[-1], newer]))
+        return keep
+
+
+def iter_csv_chunks(path, chunk_size):
+    yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+def iter_xlsx_chunks(path, chunk_size):
+    """Stream an XLSX sheet through openpyxl's read-only row iterator."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+def export_format(path):
+    return "xlsx" if path.lower().endswith((".xlsx", ".xlsm")) else "csv"
+
+
+def iter_chunks(path, chunk_size, fmt=None):
+    if (fmt or export_format(path)) == "xlsx":
+        return iter_xlsx_chunks(path, chunk_size)
+    return iter_csv_chunks(path, chunk_size)
+
+
+def read_export(path, fmt=None):
+    """Load a whole raw export."""
+    if (fmt or export_format(path)) == "xlsx":
+        return pd.read_excel(path)
+    return pd.read_csv(path)
+
+
+def clean_file(input_path, output_path, chunk_size=50000, fmt=None, rename=None, label=""):
+    """Stream-clean `input_path` into `output_path` (Parquet, or CSV by extension) with flat peak memory.
+
+    Each chunk is cleaned, deduplicated against every earlier chunk and
+    appended to the output. Returns (rows read, rows written).
+    """
+    start = time.perf_counter()
+    seen = SeenSet()
+    rows_in = rows_out = 0
+    prefix = f"{label}: " if label else ""
+
+    with DatasetWriter(output_path) as writer:
+        for chunk in iter_chunks(input_path, chunk_size, fmt=fmt):
+            rows_in += len(chunk)
+            cleaned = clean_chunk(chunk.rename(columns=rename or {}))
+            cleaned = cleaned[seen.keep_new(cleaned)]
+            writer.write(cleaned)
+            rows_out += len(cleaned)
+            print(f"🧹 {prefix}{rows_in:,} rows read, {rows_out:,} kept")
+
+    print(f"⚡ {prefix}Cleaned {rows_in:,} rows in {time.perf_counter() - start:.1f}s")
+    return rows_in, rows_out
+
+
+def clean_app(key, fmt="parquet", chunked=False, chunk_size=50000, source=None, output=None):
+    """Clean one app from the registry (utils/apps.py) and return a summary dict.
+
+    `source` and `output` override the registry paths; `fmt` picks Parquet
+    or a CSV export and `chunked` streams the export with flat memory.
+    """
+    app = get_app(key)
+    source = source or app["source"]
+    output = with_format(output or app["cleaned"], fmt)
+    start = time.perf_counter()
+    if chunked:
+        rows_in, rows_out = clean_file(source, output, chunk_size=chunk_size, fmt=app["format"],
+                                       rename=app["rename"], label=app["name"])
+    else:
+        df = read_export(source, app["format"]).rename(columns=app["rename"])
+        rows_in = len(df)
+        df = clean_frame(df)
+        write_dataset(df, output)
+        rows_out = len(df)
+    seconds = time.perf_counter() - start
+    print(f"✅ {app['name']}: {rows_out:,} of {rows_in:,} rows cleaned into {output} ({seconds:.1f}s)")
+    return {"app": key, "output": output, "rows_in": rows_in, "rows_out": rows_out, "seconds": seconds}
+
+
+def clean_apps(keys, workers=None, **options):
+    """Clean several apps at once, one process per app, so wall time follows the largest export.
+
+    `options` are passed to clean_app. Returns the summaries in `keys` order.
+    """
+    keys = list(dict.fromkeys(keys))
+    for key in keys:
+        get_app(key)
+    workers = min(workers or os.cpu_count() or 1, len(keys))
+    if workers <= 1:
+        return [clean_app(key, **options) for key in keys]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(clean_app, key, **options): key for key in keys}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [results[key] for key in keys]
+
+
+def add_cleaning_args(parser):
+    """Register the options shared by the cleaning scripts."""
+    parser.add_argument("--chunked", action="store_true", help="Stream the export in chunks with flat memory use")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows per chunk in --chunked mode")
+    add_format_arg(parser)
+    return parser
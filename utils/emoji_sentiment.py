@@ -0,0 +1,81 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+MODES = ["first", "majority"]
+
+# Emoji sentiment lexicon shared by every script and the dashboards.
+# Keys are bare emoji: variation selectors and skin tones are ignored when
+# matching, so "❤" and "❤️" or "👍" and "👍🏽" score the same.
+EMOJI_SENTIMENT_MAP = {
+    # Positive
+    "😊": "positive", "😍": "positive", "😁": "positive", "😃": "positive", "😄": "positive",
+    "😎": "positive", "😜": "positive", "🥰": "positive", "🤩": "positive", "🤗": "positive",
+    "❤": "positive", "👍": "positive", "👌": "positive", "🔥": "positive", "✨": "positive",
+    # Negative
+    "😡": "negative", "😠": "negative", "🤬": "negative", "😢": "negative", "😭": "negative",
+    "😞": "negative", "😣": "negative", "😩": "negative", "😱": "negative", "🥴": "negative",
+    "👎": "negative", "💔": "negative", "💀": "negative",
+    # Neutral
+    "😐": "neutral", "😕": "neutral", "😂": "neutral", "🥺": "neutral", "🤔": "neutral",
+    "🙏": "neutral",
+}
+
+# Trailing variation selector or skin-tone modifier, dropped before lookup
+_MODIFIERS = "[\\ufe0f\\U0001F3FB-\\U0001F3FF]*"
+_LEXICON_PATTERN = re.compile(
+    "(" + "|".join(re.escape(key) for key in sorted(EMOJI_SENTIMENT_MAP, key=len, reverse=True)) + ")" + _MODIFIERS
+)
+
+
+def emoji_polarity(emoji_char):
+    """Lexicon label for a single emoji, "neutral" when it is not in the lexicon."""
+    match = _LEXICON_PATTERN.fullmatch(str(emoji_char))
+    return EMOJI_SENTIMENT_MAP[match.group(1)] if match else "neutral"
+
+
+def _lexicon_hits(emojis):
+    # One regex pass over the whole Series, exploded to one entry per lexicon
+    # hit; the index repeats the row's position, in hit order, so duplicate
+    # labels in the caller's index stay separate rows
+    emojis = pd.Series(emojis).fillna("").astype(str)
+    positions = emojis.reset_index(drop=True)
+    candidates = positions[positions.str.len() > 0]
+    hits = candidates.str.findall(_LEXICON_PATTERN).explode().dropna()
+    return emojis.index, hits.map(EMOJI_SENTIMENT_MAP).astype(object)
+
+
+def emoji_polarity_counts(emojis):
+    """Count positive and negative lexicon emoji in every row of a Series."""
+    index, polarity = _lexicon_hits(emojis)
+    counts = pd.DataFrame({
+        "positive": (polarity == "positive").groupby(level=0).sum(),
+        "negative": (polarity == "negative").groupby(level=0).sum(),
+    })
+    counts = counts.reindex(np.arange(len(index)), fill_value=0).astype(int)
+    return counts.set_axis(index)
+
+
+def score_emoji_sentiment(emojis, mode="first"):
+    """Label every row of a Series of emoji strings as positive, negative or neutral.
+
+    "first" takes the label of the first emoji found in the lexicon (neutral
+    entries included); "majority" compares the positive and negative counts
+    and falls back to neutral on a tie.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown emoji sentiment mode {mode!r}, expected one of {MODES}")
+    if mode == "majority":
+        counts = emoji_polarity_counts(emojis)
+        labels = np.select(
+            [counts["positive"] > counts["negative"], counts["negative"] > counts["positive"]],
+            ["positive", "negative"],
+            default="neutral",
+        )
+        return pd.Series(labels, index=counts.index, dtype=object)
+
+    index, polarity = _lexicon_hits(emojis)
+    first = polarity[~polarity.index.duplicated()]
+    labels = first.reindex(np.arange(len(index))).fillna("neutral").astype(object)
+    return labels.set_axis(index)
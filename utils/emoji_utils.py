@@ -0,0 +1,112 @@
+import re
+from functools import lru_cache
+
+import emoji
+import pandas as pd
+
+
+def _trie_regex(node):
+    # Alternatives share their common prefixes, and every optional tail is
+    # greedy, so the regex always takes the longest emoji at a position
+    branches = []
+    leaves = []
+    for char, child in sorted(node.items()):
+        if char == "":
+            continue
+        tail = _trie_regex(child)
+        if tail:
+            branches.append(re.escape(char) + tail)
+        else:
+            leaves.append(re.escape(char))
+    if leaves:
+        branches.append(leaves[0] if len(leaves) == 1 else "[" + "".join(leaves) + "]")
+    if not branches:
+        return ""
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if "" in node else pattern
+
+
+def _char_class(codepoints, gap=0):
+    # Merge sorted codepoints into ranges, tolerating `gap` unused codepoints
+    # between neighbours so the class stays short enough to test quickly
+    ranges = []
+    for codepoint in codepoints:
+        if ranges and codepoint - ranges[-1][1] <= gap + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return "[" + "".join(
+        re.escape(chr(low)) if low == high else f"{re.escape(chr(low))}-{re.escape(chr(high))}"
+        for low, high in ranges
+    ) + "]"
+
+
+def build_emoji_pattern(emojis=None):
+    """Compile a longest-match regex over every emoji sequence, built from a codepoint trie.
+
+    Multi-codepoint emoji such as "❤️", skin-tone variants, flags and ZWJ
+    sequences are matched as one unit instead of being split into pieces.
+    """
+    trie = {}
+    for sequence in emojis if emojis is not None else emoji.EMOJI_DATA:
+        node = trie
+        for char in sequence:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    # The re module tries alternatives one by one, so a position is first
+    # screened by a coarse class of possible first codepoints (keycaps only
+    # when a keycap mark follows the digit), then dispatched by 256-codepoint
+    # page to a much smaller sub-trie
+    first = sorted(ord(char) for char in trie)
+    ascii_first = [codepoint for codepoint in first if codepoint < 128]
+    other_first = [codepoint for codepoint in first if codepoint >= 128]
+    screens = []
+    if other_first:
+        screens.append(_char_class(other_first, gap=64))
+    if ascii_first:
+        screens.append(_char_class(ascii_first) + "[\ufe0f\u20e3]")
+
+    pages = {}
+    for char, child in trie.items():
+        pages.setdefault(ord(char) >> 8, {})[char] = child
+    branches = [
+        f"(?={_char_class(sorted(ord(char) for char in page), gap=256)}){_trie_regex(page)}"
+        for _, page in sorted(pages.items())
+    ]
+    return re.compile("(?=" + "|".join(screens) + ")(?:" + "|".join(branches) + ")")
+
+
+@lru_cache(maxsize=1)
+def emoji_pattern():
+    # Compiled on first use so importing this module stays cheap for
+    # scripts that never extract emojis
+    return build_emoji_pattern()
+
+
+def split_emojis(text):
+    """List of the emoji in `text`, one entry per (possibly multi-codepoint) emoji."""
+    return emoji_pattern().findall(text)
+
+
+def extract_emojis(text):
+    return "".join(emoji_pattern().findall(text))
+
+
+def extract_emojis_series(texts):
+    """Extract emojis from a whole Series at once.
+
+    Every emoji sequence contains a non-ASCII codepoint, so pure ASCII
+    reviews (the large majority) are skipped before the emoji regex runs.
+    """
+    texts = pd.Series(texts).fillna("").astype(str)
+    result = pd.Series("", index=texts.index, dtype=object)
+    candidates = texts.str.contains(r"[^\x00-\x7f]", regex=True)
+    if candidates.any():
+        result[candidates] = texts[candidates].str.findall(emoji_pattern()).str.join("")
+    return result
+
+
+def extract_emojis_per_char(text):
+    """The old per-character extractor, kept only as the benchmark baseline."""
+    return ''.join(c for c in text if c in emoji.EMOJI_DATA)
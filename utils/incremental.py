@@ -0,0 +1,221 @@
+import os
+import shutil
+import sqlite3
+import time
+
+import pandas as pd
+
+from utils import partitioned
+from utils.cleaning import clean_chunk, iter_chunks
+from utils.multi_scorer import ensure_text_columns, score_chunk
+from utils.review_frame import DERIVED_COLUMNS
+from utils.storage import DatasetWriter, dataset_columns, dataset_format, iter_dataset, write_dataset
+
+# SQLite caps the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+# Delta parts a Parquet output collects before it is compacted into one file
+MAX_PARTS = 32
+
+# Fields that change when a user edits a review
+HASH_COLUMNS = ["content", "score"]
+
+
+def default_index_path(cleaned_path):
+    name = os.path.splitext(os.path.basename(cleaned_path))[0]
+    return os.path.join("data", "cache", f"{name}_index.sqlite")
+
+
+def content_hashes(df):
+    """Hex digest of each raw row's content and rating, used to spot edited reviews.
+
+    Both fields are hashed in a canonical text form, so a hash does not
+    depend on the dtype pandas inferred for the chunk: a score is "5"
+    whether the column came out as int64, float64 (one missing rating is
+    enough) or text, and a missing value is always "<NA>".
+    """
+    canonical = pd.DataFrame({
+        "content": df["content"].astype(object).where(df["content"].notna(), "<NA>").astype(str),
+        "score": pd.to_numeric(df["score"], errors="coerce").round().astype("Int64").astype(str),
+    }, index=df.index)
+    hashes = pd.util.hash_pandas_object(canonical[HASH_COLUMNS], index=False)
+    return pd.Series([format(value, "016x") for value in hashes.to_numpy()], index=df.index)
+
+
+class ReviewIndex:
+    """Persistent SQLite record of every processed reviewId and its content hash.
+
+    A review whose id is missing is new; one whose hash differs from the
+    stored one has been edited since the last run. Lookups touch only the
+    ids in the current chunk, so checking an export costs one indexed
+    query per few hundred rows regardless of how much history is stored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS reviews ("
+            "review_id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+
+    def lookup(self, review_ids):
+        """Return {reviewId: content hash} for the ids already processed."""
+        review_ids = list(dict.fromkeys(review_ids))
+        found = {}
+        for i in range(0, len(review_ids), _QUERY_CHUNK):
+            chunk = review_ids[i:i + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self.conn.execute(
+                f"SELECT review_id, content_hash FROM reviews WHERE review_id IN ({placeholders})", chunk
+            ).fetchall())
+        return found
+
+    def record(self, hashes):
+        """Store {reviewId: content hash} once the matching rows are safely in the outputs."""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO reviews (review_id, content_hash, updated_at) VALUES (?, ?, ?)",
+            [(review_id, content_hash, now) for review_id, content_hash in hashes.items()],
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def merge_into_dataset(path, delta, replaced_ids, chunk_size=50000, max_parts=MAX_PARTS):
+    """Merge `delta` into the Parquet or CSV dataset at `path`, replacing rows whose reviewId is in `replaced_ids`.
+
+    A Parquet output becomes a partitioned dataset (utils/partitioned.py):
+    each run adds the delta as one more part, listing the reviewIds it
+    replaces so readers skip their older rows, so a run writes only its
+    delta. Once there are more than `max_parts` parts they are compacted
+    back into a single file.
+
+    A CSV with nothing to replace simply gets the delta appended. Otherwise
+    the existing CSV is streamed once into a temporary copy without the
+    replaced rows, followed by the delta, and swapped in atomically.
+    """
+    if not os.path.exists(path):
+        write_dataset(delta, path)
+        return
+    delta = delta.drop(columns=[column for column in DERIVED_COLUMNS if column in delta.columns])
+    if dataset_format(path) == "parquet":
+        if not partitioned.is_partitioned(path):
+            partitioned.convert_to_parts(path)
+        partitioned.append_part(path, delta, replaced_ids)
+        if partitioned.part_count(path) > max_parts:
+            compact_dataset(path, chunk_size=chunk_size)
+        return
+
+    header = dataset_columns(path)
+    columns = header + [column for column in delta.columns if column not in header]
+    delta = delta.reindex(columns=columns)
+    if not replaced_ids and len(columns) == len(header):
+        delta.to_csv(path, mode="a", header=False, index=False)
+        return
+
+    root, ext = os.path.splitext(path)
+    tmp_path = root + ".tmp" + ext
+    with DatasetWriter(tmp_path) as writer:
+        for chunk in iter_dataset(path, chunk_size):
+            chunk = chunk[~chunk["reviewId"].astype(str).isin(replaced_ids)]
+            if len(chunk):
+                writer.write(chunk.reindex(columns=columns))
+        if len(delta) or writer.rows == 0:
+            writer.write(delta)
+    os.replace(tmp_path, path)
+
+
+def compact_dataset(path, chunk_size=50000):
+    """Rewrite a partitioned Parquet dataset as one file holding only each review's latest row."""
+    root, ext = os.path.splitext(path)
+    tmp_path = root + ".tmp" + ext
+    columns = dataset_columns(path)
+    with DatasetWriter(tmp_path) as writer:
+        for chunk in iter_dataset(path, chunk_size):
+            writer.write(chunk)
+        if writer.rows == 0:
+            writer.write(pd.DataFrame(columns=columns))
+    shutil.rmtree(path)
+    os.replace(tmp_path, path)
+    print(f"🗜️ Compacted {path} into a single file of {writer.rows:,} rows")
+
+
+def find_delta(input_path, index, chunk_size=50000):
+    """Stream an export and return (cleaned new/edited rows, their hashes, edited reviewIds).
+
+    Unchanged reviews are skipped before cleaning. A reviewId that appears
+    more than once keeps its last version, as a later row is a later edit.
+    """
+    pending = {}
+    edited = set()
+    frames = []
+    rows_in = 0
+    for chunk in iter_chunks(input_path, chunk_size):
+        rows_in += len(chunk)
+        chunk = chunk.dropna(subset=["reviewId"]).astype({"reviewId": str})
+        hashes = content_hashes(chunk)
+
+        known = index.lookup(chunk["reviewId"])
+        known.update((review_id, pending[review_id]) for review_id in chunk["reviewId"] if review_id in pending)
+        previous = chunk["reviewId"].map(known)
+        changed = previous.isna() | (previous != hashes)
+        if not changed.any():
+            continue
+
+        delta = chunk[changed]
+        edited.update(delta["reviewId"][previous[changed].notna()])
+        pending.update(zip(delta["reviewId"], hashes[changed]))
+        frames.append(clean_chunk(delta))
+        print(f"🔍 {rows_in:,} rows read, {len(pending):,} new or edited")
+
+    if not frames:
+        return pd.DataFrame(), pending, edited
+    delta = pd.concat(frames).drop_duplicates(subset="reviewId", keep="last")
+    return delta.reset_index(drop=True), pending, edited
+
+
+def incremental_update(input_path, cleaned_path, scored_path, scorers, index, chunk_size=50000, score_chunk_size=5000):
+    """Clean and score only the reviews in `input_path` that are new or edited since the last run.
+
+    Results are merged into `cleaned_path` and `scored_path` keyed on
+    reviewId, so each review keeps only its latest version. The index is
+    updated last, so an interrupted run simply redoes the same delta.
+    Returns the number of new and edited reviews.
+    """
+    start = time.perf_counter()
+    bootstrap = len(index) == 0
+    delta, hashes, edited = find_delta(input_path, index, chunk_size=chunk_size)
+    if not hashes:
+        print(f"✅ No new or edited reviews in {input_path} ({time.perf_counter() - start:.1f}s)")
+        return 0, 0
+
+    # On the first run the outputs may already hold these reviews from a
+    # full clean, so every delta row replaces any older copy
+    replaced = set(hashes) if bootstrap else edited
+    scored = [
+        score_chunk(ensure_text_columns(delta.iloc[i:i + score_chunk_size].copy()), scorers)
+        for i in range(0, len(delta), score_chunk_size)
+    ]
+    if scored:
+        merge_into_dataset(cleaned_path, delta, replaced, chunk_size=chunk_size)
+        merge_into_dataset(scored_path, pd.concat(scored), replaced, chunk_size=chunk_size)
+    elif replaced:
+        # Edits that emptied a review only remove its old rows
+        for path in (cleaned_path, scored_path):
+            if os.path.exists(path):
+                merge_into_dataset(path, pd.DataFrame(columns=["reviewId"]), replaced, chunk_size=chunk_size)
+
+    index.record(hashes)
+    new = len(hashes) - len(edited)
+    print(f"⚡ {new:,} new and {len(edited):,} edited reviews cleaned and scored "
+          f"in {time.perf_counter() - start:.1f}s ({len(index):,} reviews indexed)")
+    return new, len(edited)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+DEFAULT_CACHE_PATH = "data/cache/inference_cache.sqlite"
+DEFAULT_MAX_MB = 512
+
+# SQLite caps the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+
+def normalize_text(text):
+    """Case- and whitespace-insensitive form of a review, used only as a dedupe and cache key."""
+    text = unicodedata.normalize("NFC", str(text))
+    return " ".join(text.lower().split())
+
+
+class InferenceCache:
+    """Persistent SQLite cache of model predictions keyed by normalized text.
+
+    Keys combine the model name and revision with the normalized text, so a
+    new model or checkpoint never reuses stale labels. Entries are evicted
+    least-recently-used first once the stored payload exceeds `max_mb`.
+    The connection is shared between pipeline threads behind a lock.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_mb=DEFAULT_MAX_MB):
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS predictions ("
+            "key TEXT PRIMARY KEY, label TEXT NOT NULL, scores TEXT NOT NULL, "
+            "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON predictions (last_used)")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evicted = 0
+
+    @staticmethod
+    def make_key(text, model_name, revision):
+        payload = f"{model_name}\0{revision}\0{normalize_text(text)}"
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys):
+        """Return {key: (label, scores)} for the keys that are cached."""
+        with self.lock:
+            return self._get_many(keys)
+
+    def _get_many(self, keys):
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for i in range(0, len(keys), _QUERY_CHUNK):
+            chunk = keys[i:i + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT key, label, scores FROM predictions WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, label, scores in rows:
+                found[key] = (label, json.loads(scores))
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE predictions SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+            )
+            self.conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """Store (key, label, scores) triples and evict old entries if over budget."""
+        with self.lock:
+            self._put_many(items)
+
+    def _put_many(self, items):
+        now = time.time()
+        rows = []
+        for key, label, scores in items:
+            scores = json.dumps([round(float(s), 6) for s in scores])
+            rows.append((key, label, scores, len(key) + len(label) + len(scores), now))
+        if not rows:
+            return
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO predictions (key, label, scores, size, last_used) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.conn.commit()
+        self.writes += len(rows)
+        self.evict()
+
+    def size_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM predictions").fetchone()[0]
+
+    def evict(self):
+        excess = self.size_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        freed = 0
+        stale = []
+        for key, size in self.conn.execute("SELECT key, size FROM predictions ORDER BY last_used"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self.conn.executemany("DELETE FROM predictions WHERE key = ?", stale)
+        self.conn.commit()
+        self.evicted += len(stale)
+
+    def report(self):
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0.0
+        entries = self.conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+        print(f"🗃️ Inference cache: {self.hits:,}/{lookups:,} lookups hit ({hit_rate:.1f}%), "
+              f"{self.writes:,} new entries, {self.evicted:,} evicted, "
+              f"{entries:,} entries ({self.size_bytes() / 1024 / 1024:.1f} MB) in {self.path}")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,145 @@
+import time
+
+import pandas as pd
+
+from utils.checkpoint import ProgressMeter
+from utils.emoji_sentiment import score_emoji_sentiment
+from utils.emoji_utils import extract_emojis_series
+from utils.review_frame import combined_text
+from utils.scoring_cli import build_scorer, close_scorer
+from utils.sentiment_engine import LABEL_MAP
+from utils.storage import DatasetWriter, count_rows, iter_dataset
+from utils.streaming import run_stages
+
+SCORERS = ["vader", "roberta", "emoji"]
+
+
+def ensure_text_columns(chunk):
+    """Add `emojis` and `combined` when a chunk comes straight from a cleaner without them."""
+    chunk["content"] = chunk["content"].fillna("").astype(str)
+    if "emojis" not in chunk.columns:
+        chunk["emojis"] = extract_emojis_series(chunk["content"])
+    if "combined" not in chunk.columns:
+        chunk["combined"] = combined_text(chunk)
+    return chunk
+
+
+class VaderScorer:
+    """VADER compound score and label, as in scripts/sentiment_analysis.py."""
+
+    name = "vader"
+
+    def __init__(self, workers=1):
+        # Imported here so runs without the VADER scorer do not need vaderSentiment
+        from utils.vader_scoring import VaderEngine
+
+        self.engine = VaderEngine(workers=workers)
+
+    def __call__(self, chunk):
+        from utils.vader_scoring import label_scores
+
+        scores = self.engine.compound(chunk["content"])
+        return pd.DataFrame({"sentiment_score": scores, "sentiment_label": label_scores(scores)}, index=chunk.index)
+
+    def close(self):
+        self.engine.close()
+
+
+class RobertaScorer:
+    """RoBERTa (or surrogate) labels on `combined`, via a BatchSentimentScorer."""
+
+    name = "roberta"
+
+    def __init__(self, scorer):
+        self.scorer = scorer
+
+    def __call__(self, chunk):
+        results = self.scorer.score(chunk["combined"])
+        results.index = chunk.index
+        return pd.DataFrame({
+            "hf_sentiment": results["label"],
+            "hf_error": results["error"],
+            "hf_sentiment_label": results["label"].map(LABEL_MAP),
+        })
+
+
+class EmojiScorer:
+    """Emoji sentiment from the shared lexicon, by first match or majority vote."""
+
+    name = "emoji"
+
+    def __init__(self, mode="first"):
+        self.mode = mode
+
+    def __call__(self, chunk):
+        return pd.DataFrame({"emoji_sentiment": score_emoji_sentiment(chunk["emojis"], mode=self.mode)}, index=chunk.index)
+
+
+def build_scorers(args):
+    """Build the scorers named in `args.scorers`; returns (scorers, RoBERTa scorer or None)."""
+    scorers = []
+    roberta = None
+    for name in args.scorers:
+        if name == "vader":
+            scorers.append(VaderScorer(workers=args.vader_workers))
+        elif name == "roberta":
+            roberta = build_scorer(args)
+            scorers.append(RobertaScorer(roberta))
+        elif name == "emoji":
+            scorers.append(EmojiScorer(mode=args.emoji_mode))
+    return scorers, roberta
+
+
+def close_scorers(scorers, roberta=None):
+    if roberta is not None:
+        close_scorer(roberta)
+    for scorer in scorers:
+        if hasattr(scorer, "close"):
+            scorer.close()
+
+
+def score_chunk(chunk, scorers, timings=None):
+    """Run every scorer over `chunk` and add their columns to it, timing each into `timings`."""
+    for scorer in scorers:
+        start = time.perf_counter()
+        columns = scorer(chunk)
+        if timings is not None:
+            timings[scorer.name] = timings.get(scorer.name, 0.0) + time.perf_counter() - start
+        for column in columns.columns:
+            chunk[column] = columns[column]
+    return chunk
+
+
+def score_dataset(input_path, output_path, scorers, chunk_size=5000, queue_depth=4):
+    """Read `input_path` once and run every scorer over each chunk, writing one combined output.
+
+    Reading, scoring and writing run in separate threads connected by
+    bounded queues, so memory stays bounded by the queue depth. Either
+    path may be Parquet or CSV, chosen by extension.
+    """
+    progress = ProgressMeter(count_rows(input_path))
+    timings = {scorer.name: 0.0 for scorer in scorers}
+    writer = DatasetWriter(output_path)
+
+    def read_chunks():
+        for chunk in iter_dataset(input_path, chunk_size):
+            yield ensure_text_columns(chunk)
+
+    def score(chunk):
+        return score_chunk(chunk, scorers, timings)
+
+    def write(chunk):
+        writer.write(chunk)
+        progress.update(len(chunk))
+
+    start = time.perf_counter()
+    try:
+        run_stages(read_chunks(), [score, write], queue_depth=queue_depth)
+    finally:
+        writer.close()
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"⚡ Scored {progress.done:,} reviews with {', '.join(timings)} in {elapsed:.1f}s "
+          f"({progress.done / elapsed:.1f} rows/s)")
+    for name, seconds in timings.items():
+        print(f"   {name:<8} {seconds:6.1f}s")
+    return progress.done
@@ -0,0 +1,99 @@
+import re
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from utils.inference_cache import normalize_text
+
+# Shingle hashes and permutations live below this Mersenne prime, so
+# a * hash + b fits in 64 bits
+_PRIME = (1 << 31) - 1
+_ROLLING_BASE = np.uint32(1_000_003)
+# ASCII punctuation, ignored when comparing reviews ("fix!!" vs "fix.")
+_PUNCTUATION = re.compile(r"[!-/:-@\[-`{-~]")
+
+
+def _shingle_hashes(texts, shingle):
+    """Hash every `shingle`-character window of each normalized text.
+
+    Returns (hashes, starts): the hashes of all texts back to back and the
+    offset where each text's hashes begin. Texts shorter than a shingle are
+    padded so every text has at least one.
+    """
+    texts = [normalize_text(_PUNCTUATION.sub("", str(text))).ljust(shingle) for text in texts]
+    lengths = np.array([len(text) for text in texts])
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+
+    # Polynomial rolling hash over every window, wrapping at 2**32
+    windows = np.lib.stride_tricks.sliding_window_view(codes, shingle)
+    powers = _ROLLING_BASE ** np.arange(shingle - 1, -1, -1, dtype=np.uint32)
+    hashes = (windows * powers).sum(axis=1, dtype=np.uint32)
+
+    # Drop windows that run across the end of a text into the next one
+    counts = lengths - shingle + 1
+    starts = np.r_[0, np.cumsum(counts)[:-1]]
+    offsets = np.arange(counts.sum()) - np.repeat(starts, counts)
+    keep = np.repeat(np.r_[0, np.cumsum(lengths)[:-1]], counts) + offsets
+    return hashes[keep].astype(np.uint64) % _PRIME, starts
+
+
+def minhash_signatures(texts, num_perm=128, shingle=5, seed=1, chunk_size=20000):
+    """MinHash signature (num_perm values) of each text's character shingles."""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+    texts = list(texts)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    for start in range(0, len(texts), chunk_size):
+        hashes, starts = _shingle_hashes(texts[start:start + chunk_size], shingle)
+        for k in range(num_perm):
+            signatures[start:start + len(starts), k] = np.minimum.reduceat((a[k] * hashes + b[k]) % _PRIME, starts)
+    return signatures
+
+
+def near_duplicate_clusters(texts, threshold=0.8, num_perm=128, bands=16, shingle=5):
+    """Cluster id for every text, shared by texts that are near-duplicates of each other.
+
+    Signatures are split into `bands`; texts that agree on a whole band
+    become candidates (LSH), and a candidate pair is linked when its
+    estimated Jaccard similarity reaches `threshold`. Clusters are the
+    connected groups of links, numbered in order of their first member.
+    """
+    signatures = minhash_signatures(texts, num_perm=num_perm, shingle=shingle)
+    n = len(signatures)
+    rows = num_perm // bands
+    multipliers = np.random.default_rng(0).integers(1, 1 << 63, size=rows, dtype=np.uint64)
+    left, right = [np.arange(n)], [np.arange(n)]
+    for band in range(bands):
+        keys = (signatures[:, band * rows:(band + 1) * rows] * multipliers).sum(axis=1)
+        codes, _ = pd.factorize(keys)
+        first = np.unique(codes, return_index=True)[1][codes]
+        candidates = np.flatnonzero(first != np.arange(n))
+        similarity = (signatures[candidates] == signatures[first[candidates]]).mean(axis=1)
+        linked = candidates[similarity >= threshold]
+        left.append(linked)
+        right.append(first[linked])
+    left, right = np.concatenate(left), np.concatenate(right)
+    graph = coo_matrix((np.ones(len(left), dtype=np.int8), (left, right)), shape=(n, n))
+    return connected_components(graph, directed=False)[1]
+
+
+def first_members(cluster_ids):
+    """Position of the first row of each cluster, in cluster id order."""
+    return np.unique(np.asarray(cluster_ids), return_index=True)[1]
+
+
+def expand_to_clusters(results, cluster_ids):
+    """Copy per-cluster results (one row per cluster, in cluster id order) to every member."""
+    _, inverse = np.unique(np.asarray(cluster_ids), return_inverse=True)
+    return results.iloc[inverse].reset_index(drop=True)
+
+
+def add_near_duplicate_args(parser):
+    """Register the near-duplicate collapse option shared by the sentiment scripts."""
+    parser.add_argument("--near-dup-threshold", type=float, default=None,
+                        help="Score one review per cluster of near-duplicates at this estimated Jaccard "
+                             "similarity (e.g. 0.8) and copy its label to the rest; off by default")
+    return parser
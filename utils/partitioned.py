@@ -0,0 +1,121 @@
+import json
+import os
+
+import pandas as pd
+
+from utils.review_frame import compact_frame
+
+MANIFEST = "manifest.json"
+
+
+def is_partitioned(path):
+    """Whether `path` is a Parquet dataset split into delta parts (a directory with a manifest)."""
+    return os.path.isfile(os.path.join(path, MANIFEST))
+
+
+def _load_manifest(path):
+    with open(os.path.join(path, MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_manifest(path, manifest):
+    # Written last and swapped in atomically, so an interrupted append leaves
+    # at most an unlisted part file behind
+    manifest_path = os.path.join(path, MANIFEST)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def part_count(path):
+    return len(_load_manifest(path)["parts"])
+
+
+def convert_to_parts(path):
+    """Turn the single Parquet file at `path` into a partitioned dataset whose first part is that file."""
+    moved = path + ".base"
+    os.replace(path, moved)
+    os.makedirs(path)
+    os.replace(moved, os.path.join(path, "part-00000.parquet"))
+    _save_manifest(path, {"parts": [{"file": "part-00000.parquet", "replaces": None}]})
+
+
+def append_part(path, delta, replaced_ids):
+    """Add `delta` as a new part; rows of earlier parts whose reviewId is in `replaced_ids` stop being read."""
+    manifest = _load_manifest(path)
+    number = len(manifest["parts"])
+    entry = {"file": None, "replaces": None}
+    if len(delta):
+        entry["file"] = f"part-{number:05d}.parquet"
+        _write(compact_frame(delta), os.path.join(path, entry["file"]))
+    if replaced_ids:
+        entry["replaces"] = f"replaced-{number:05d}.parquet"
+        _write(pd.DataFrame({"reviewId": sorted(map(str, replaced_ids))}), os.path.join(path, entry["replaces"]))
+    manifest["parts"].append(entry)
+    _save_manifest(path, manifest)
+
+
+def _write(df, file_path):
+    tmp_path = file_path + ".tmp"
+    df.to_parquet(tmp_path, index=False, compression="zstd")
+    os.replace(tmp_path, file_path)
+
+
+def _parts(path):
+    # (part file, reviewId sets of every later part that replaced rows) in write order
+    parts = _load_manifest(path)["parts"]
+    replaced = [set(pd.read_parquet(os.path.join(path, entry["replaces"]))["reviewId"]) if entry["replaces"] else None
+                for entry in parts]
+    return [(os.path.join(path, entry["file"]), [ids for ids in replaced[i + 1:] if ids])
+            for i, entry in enumerate(parts) if entry["file"]]
+
+
+def _superseded(review_ids, dropped):
+    review_ids = review_ids.astype(str)
+    mask = pd.Series(False, index=review_ids.index)
+    for ids in dropped:
+        mask |= review_ids.isin(ids)
+    return mask
+
+
+def part_columns(path):
+    """Column names across every part, in the order they first appear."""
+    import pyarrow.parquet as pq
+
+    names = {}
+    for file_path, _ in _parts(path):
+        names.update(dict.fromkeys(pq.ParquetFile(file_path).schema_arrow.names))
+    return list(names)
+
+
+def iter_parts(path, chunk_size=None, columns=None):
+    """Yield the current rows of every part, in write order, without superseded versions."""
+    import pyarrow.parquet as pq
+
+    # Parts written before a column existed come back with it empty
+    names = part_columns(path) if columns is None else list(columns)
+    for file_path, dropped in _parts(path):
+        parquet_file = pq.ParquetFile(file_path)
+        stored = parquet_file.schema_arrow.names
+        wanted = [column for column in names if column in stored]
+        read = wanted if not dropped or "reviewId" in wanted else wanted + ["reviewId"]
+        for batch in parquet_file.iter_batches(batch_size=chunk_size or 65536, columns=read):
+            chunk = batch.to_pandas()
+            if dropped:
+                chunk = chunk[~_superseded(chunk["reviewId"], dropped)]
+            if len(chunk):
+                yield chunk.reindex(columns=names)
+
+
+def count(path):
+    """Current rows, reading only reviewIds of parts that have superseded rows."""
+    import pyarrow.parquet as pq
+
+    total = 0
+    for file_path, dropped in _parts(path):
+        if dropped:
+            ids = pd.read_parquet(file_path, columns=["reviewId"])["reviewId"]
+            total += int((~_superseded(ids, dropped)).sum())
+        else:
+            total += pq.ParquetFile(file_path).metadata.num_rows
+    return total
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+# Inputs up to this many rows are plotted as they are
+RAW_ROW_LIMIT = 5000
+# Points kept by LTTB downsampling of line plots
+LINE_POINTS = 1000
+# Time buckets aimed for when bucketing timestamps
+TIME_BUCKETS = 200
+# Bins for bar plots over a continuous numeric axis
+NUMERIC_BINS = 50
+# Pie slices drawn before the rest are merged into "other"
+PIE_SLICES = 12
+
+# Pseudo-column: number of reviews in each group
+COUNT_COLUMN = "reviewCount"
+
+# Candidate bucket sizes for timestamps, finest first
+_FREQUENCIES = [("h", pd.Timedelta(hours=1)), ("D", pd.Timedelta(days=1)), ("W", pd.Timedelta(weeks=1)),
+                ("M", pd.Timedelta(days=31)), ("Q", pd.Timedelta(days=92)), ("Y", pd.Timedelta(days=366))]
+
+
+def lttb(x, y, points):
+    """Largest-Triangle-Three-Buckets: indices of `points` samples that keep the shape of the line (x, y).
+
+    `x` must be sorted and numeric. The first and last points are always
+    kept; every bucket in between keeps the point forming the largest
+    triangle with the previously kept point and the next bucket's mean.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, points - 1).astype(int)
+    keep = np.empty(points, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    previous = 0
+    for i in range(points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        keep[i + 1] = previous
+    return keep
+
+
+def time_frequency(times, buckets=TIME_BUCKETS):
+    """The finest pandas period frequency giving at most about `buckets` buckets over `times`."""
+    span = times.max() - times.min()
+    for frequency, width in _FREQUENCIES:
+        if span / width <= buckets:
+            return frequency
+    return _FREQUENCIES[-1][0]
+
+
+def _group(df, x, keys, y):
+    # Mean of a numeric y per group, or the number of reviews otherwise
+    if y == COUNT_COLUMN or not pd.api.types.is_numeric_dtype(df[y]):
+        return df.groupby(keys, observed=True).size().rename(COUNT_COLUMN).rename_axis(x).reset_index(), COUNT_COLUMN
+    return df.groupby(keys, observed=True)[y].mean().rename_axis(x).reset_index(), y
+
+
+def _pie_counts(values, raw):
+    counts = values.value_counts()
+    note = None
+    if len(counts) > PIE_SLICES and not raw:
+        note = f"{len(counts) - PIE_SLICES + 1:,} smallest of {len(counts):,} values merged into 'other'"
+        counts = pd.concat([counts.iloc[:PIE_SLICES - 1].rename(index=str),
+                            pd.Series({"other": counts.iloc[PIE_SLICES - 1:].sum()})])
+    return counts.rename_axis(values.name).rename(COUNT_COLUMN).reset_index(), COUNT_COLUMN, note
+
+
+def prepare_plot_data(df, x, y, plot_type, max_rows=RAW_ROW_LIMIT, raw=False):
+    """Frame of (x, y) to draw, aggregated unless it is cheap to plot row by row.
+
+    Returns (data, y column to plot, note on what was done or None). Only
+    line and scatter plots over a numeric x of at most `max_rows` rows are
+    drawn as they are; bar plots and heatmaps, time or categorical x and
+    larger inputs draw one mark per row otherwise, so they are aggregated
+    at any size. Timestamps are bucketed by a period sized to the date
+    range, categorical x values are grouped, and continuous numeric x is
+    binned for bar plots, sampled for scatter plots and LTTB-downsampled
+    for line plots. Grouped y is the mean when numeric, otherwise the
+    review count. `raw` skips all of this, except that heatmaps are still
+    grouped by x value. Pie charts get the value counts of y (of x when y
+    is the review count), with all but the largest PIE_SLICES slices
+    merged into "other".
+    """
+    if plot_type == "Pie Chart":
+        return _pie_counts(df[x if y == COUNT_COLUMN else y], raw)
+    if raw and y != COUNT_COLUMN and plot_type != "Heatmap":
+        return df, y, None
+    columns = [x] if y == COUNT_COLUMN or y == x else [x, y]
+    df = df[columns].dropna()
+    if raw:
+        # A heatmap cell is an aggregate whatever the size, and a text y can only be counted
+        data, y_plot = _group(df, x, df[x], COUNT_COLUMN if y == x else y)
+        return data, y_plot, None
+    if (len(df) <= max_rows and y != COUNT_COLUMN and plot_type in ("Line Plot", "Scatter Plot")
+            and pd.api.types.is_numeric_dtype(df[x])):
+        return df, y, None
+
+    if y == x:
+        # The mean of x within its own groups says nothing; count instead
+        y = COUNT_COLUMN
+    values = df[x]
+    if pd.api.types.is_datetime64_any_dtype(values):
+        frequency = time_frequency(values)
+        buckets = values.dt.to_period(frequency).dt.to_timestamp()
+        data, y_plot = _group(df, x, buckets, y)
+        note = f"{len(df):,} rows bucketed by period '{frequency}' into {len(data):,} points"
+        if plot_type == "Line Plot" and len(data) > LINE_POINTS:
+            data = data.iloc[lttb(data[x].astype("int64"), data[y_plot], LINE_POINTS)]
+        return data, y_plot, note
+
+    if not pd.api.types.is_numeric_dtype(values) or values.nunique() <= NUMERIC_BINS:
+        data, y_plot = _group(df, x, values, y)
+        return data, y_plot, f"{len(df):,} rows grouped into {len(data):,} values of {x}"
+    if plot_type == "Line Plot" and y != COUNT_COLUMN and pd.api.types.is_numeric_dtype(df[y]):
+        data = df.sort_values(x)
+        data = data.iloc[lttb(data[x], data[y], LINE_POINTS)]
+        return data, y, f"{len(df):,} points downsampled to {len(data):,} with LTTB"
+    if plot_type == "Scatter Plot" and y != COUNT_COLUMN:
+        data = df.sample(max_rows, random_state=0).sort_index()
+        return data, y, f"random sample of {max_rows:,} of {len(df):,} rows"
+    bins = pd.cut(values, NUMERIC_BINS).map(lambda interval: interval.mid).astype(float)
+    data, y_plot = _group(df, x, bins, y)
+    return data, y_plot, f"{len(df):,} rows binned into {NUMERIC_BINS} ranges of {x}"
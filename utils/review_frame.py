@@ -0,0 +1,74 @@
+import pandas as pd
+
+# Compact in-memory schema for review frames. Versions and labels repeat a
+# handful of values, so categoricals store them as small integer codes.
+CATEGORY_COLUMNS = [
+    "appVersion", "reviewCreatedVersion",
+    "hf_sentiment", "hf_sentiment_label", "sentiment_label", "emoji_sentiment", "text_sentiment",
+]
+DATETIME_COLUMNS = ["at"]
+INTEGER_COLUMNS = {
+    "score": "int8",  # 1-5 star rating
+    "thumbsUpCount": "uint32",
+}
+# Same widths, but able to hold missing values
+_NULLABLE = {"int8": "Int8", "uint32": "UInt32"}
+
+
+def combined_text(df):
+    """The review text followed by its emojis, as fed to RoBERTa."""
+    return df["content"].fillna("").astype(str) + " " + df["emojis"].fillna("").astype(str)
+
+
+# Columns derived from others on demand instead of being stored, with the
+# columns each one needs
+DERIVED_COLUMNS = {
+    "combined": (combined_text, ["content", "emojis"]),
+}
+
+
+def _integer_column(series, dtype, downcast):
+    series = pd.to_numeric(series, errors="coerce")
+    if series.isna().any():
+        # Nullable integers keep missing values without falling back to float64
+        return series.astype(_NULLABLE[dtype])
+    if downcast:
+        return pd.to_numeric(series, downcast="unsigned" if dtype.startswith("u") else "integer")
+    return series.astype(dtype)
+
+
+def compact_frame(df, downcast=False):
+    """Apply the compact schema and drop derived columns.
+
+    Integer columns get fixed widths so chunks written separately share one
+    schema; with `downcast` (in-memory use only) they shrink further to the
+    smallest type that holds this frame's values.
+    """
+    df = df.drop(columns=[column for column in DERIVED_COLUMNS if column in df.columns])
+    for column in DATETIME_COLUMNS:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = pd.to_datetime(df[column], errors="coerce")
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+    for column, dtype in INTEGER_COLUMNS.items():
+        if column in df.columns:
+            df[column] = _integer_column(df[column], dtype, downcast)
+    return df
+
+
+def add_derived(df, columns):
+    """Compute the requested derived columns (e.g. `combined`) on a loaded frame."""
+    for column in columns:
+        derive, _ = DERIVED_COLUMNS[column]
+        df[column] = derive(df)
+    return df
+
+
+def memory_report(frames):
+    """Per-column memory in MB for named frames, e.g. {"before": df_csv, "after": df_compact}."""
+    report = pd.DataFrame({
+        name: frame.memory_usage(deep=True, index=False) / 1024 / 1024 for name, frame in frames.items()
+    })
+    report.loc["TOTAL"] = report.sum()
+    return report
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+from utils.storage import iter_dataset
+
+
+def _period(freq):
+    return lambda chunk: pd.to_datetime(chunk["at"], errors="coerce").dt.to_period(freq).astype(str).where(
+        lambda keys: keys != "NaT"
+    )
+
+
+# Ways to split reviews into strata; each maps a chunk to one key per row,
+# NaN for rows that belong to no stratum (e.g. a missing date)
+STRATA = {
+    "month": _period("M"),
+    "week": _period("W"),
+    "day": _period("D"),
+    "version": lambda chunk: chunk["appVersion"].astype(object).fillna("unknown").astype(str),
+    "rating": lambda chunk: pd.to_numeric(chunk["score"], errors="coerce").astype("Int8").astype(str).where(
+        lambda keys: keys != "<NA>"
+    ),
+}
+
+
+def stratum_keys(chunk, strata):
+    """One key per row combining the requested strata, e.g. "2024-03|5.12.0"; NaN when any part is missing."""
+    keys = None
+    for name in strata:
+        part = STRATA[name](chunk)
+        keys = part if keys is None else keys + "|" + part
+    return keys
+
+
+def _seed_key(seed):
+    # pandas hashing takes a 16 character key
+    return f"{seed:016d}"[-16:]
+
+
+class StratifiedSampler:
+    """Streaming reservoir sample of up to `per_stratum` rows from every stratum.
+
+    Each row gets a pseudo-random priority and a stratum keeps the rows with
+    the lowest priorities seen so far, which is a uniform sample without
+    replacement. Priorities hash the row's reviewId with the seed, so the
+    same seed picks the same reviews whatever the chunk size or file order.
+    Chunks are merged with one lexsort over (stratum, priority), and memory
+    stays at one chunk plus the current reservoirs.
+    """
+
+    def __init__(self, strata=("month",), per_stratum=150, seed=42, id_column="reviewId"):
+        unknown = [name for name in strata if name not in STRATA]
+        if unknown:
+            raise ValueError(f"Unknown strata {unknown}, expected any of {list(STRATA)}")
+        self.strata = list(strata)
+        self.per_stratum = per_stratum
+        self.seed = seed
+        self.id_column = id_column
+        self.rng = np.random.default_rng(seed)
+        self.kept = None
+        self.rows_seen = 0
+
+    def _priorities(self, chunk):
+        if self.id_column in chunk.columns:
+            ids = chunk[self.id_column].astype(str)
+            return pd.util.hash_pandas_object(ids, index=False, hash_key=_seed_key(self.seed)).to_numpy()
+        return self.rng.integers(0, np.iinfo(np.uint64).max, size=len(chunk), dtype=np.uint64)
+
+    def add(self, chunk):
+        self.rows_seen += len(chunk)
+        chunk = chunk.assign(_stratum=stratum_keys(chunk, self.strata), _priority=self._priorities(chunk))
+        chunk = chunk[chunk["_stratum"].notna()]
+        pool = chunk if self.kept is None else pd.concat([self.kept, chunk], ignore_index=True)
+        self.kept = pool.iloc[self._lowest_per_stratum(pool)]
+
+    def _lowest_per_stratum(self, pool):
+        # Order rows by (stratum, priority), then keep the first `per_stratum`
+        # positions of every run of equal strata
+        codes, _ = pd.factorize(pool["_stratum"])
+        order = np.lexsort((pool["_priority"].to_numpy(), codes))
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        return order[rank < self.per_stratum]
+
+    def strata_counts(self):
+        """Rows kept per stratum so far."""
+        if self.kept is None:
+            return pd.Series(dtype=int)
+        return self.kept["_stratum"].value_counts().sort_index()
+
+    def result(self, keep_strata=False):
+        """The sample, in date order when the rows have one.
+
+        With `keep_strata` the rows also carry their `stratum` key and `draw`,
+        their position in the stratum's random order (0 is drawn first).
+        """
+        if self.kept is None:
+            return pd.DataFrame()
+        sample = self.kept.drop(columns=["_stratum", "_priority"])
+        if keep_strata:
+            # Rows are kept ordered by (stratum, priority)
+            sample["stratum"] = self.kept["_stratum"]
+            sample["draw"] = self.kept.groupby("_stratum", sort=False).cumcount()
+        if "at" in sample.columns:
+            sample = sample.assign(at=pd.to_datetime(sample["at"], errors="coerce")).sort_values("at", kind="stable")
+        return sample.reset_index(drop=True)
+
+
+def sample_dataset(path, strata=("month",), per_stratum=150, seed=42, chunk_size=50000, keep_strata=False):
+    """Stratified sample of a Parquet or CSV dataset in one streaming pass."""
+    sampler = StratifiedSampler(strata, per_stratum=per_stratum, seed=seed)
+    for chunk in iter_dataset(path, chunk_size):
+        sampler.add(chunk)
+    sample = sampler.result(keep_strata=keep_strata)
+    print(f"🔄 Sampled {len(sample):,} of {sampler.rows_seen:,} reviews "
+          f"({len(sampler.strata_counts()):,} strata by {'+'.join(sampler.strata)}, up to {per_stratum} each)")
+    return sample
+
+
+def add_sampling_args(parser):
+    """Register the stratified sampling options shared by the sentiment scripts."""
+    parser.add_argument("--strata", nargs="+", choices=list(STRATA), default=["month"],
+                        help="Sample separately within each combination of these")
+    parser.add_argument("--per-stratum", type=int, default=150, help="Reviews sampled from each stratum")
+    parser.add_argument("--seed", type=int, default=42, help="Sampling seed; the same seed gives the same sample")
+    parser.add_argument("--sample-chunk-size", type=int, default=50000, help="Rows read at a time while sampling")
+    return parser
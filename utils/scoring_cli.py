@@ -0,0 +1,98 @@
+import os
+
+from utils.checkpoint import ProgressMeter, ScoringCheckpoint, fingerprint_texts
+from utils.inference_cache import InferenceCache, DEFAULT_CACHE_PATH, DEFAULT_MAX_MB
+from utils.near_duplicates import expand_to_clusters, first_members
+from utils.sentiment_backends import BACKENDS
+from utils.sentiment_engine import BatchSentimentScorer, MODEL_NAME
+from utils.token_store import load_or_build
+
+
+def add_scoring_args(parser, checkpoints=True):
+    """Register the model, batching, worker and cache options shared by the scoring scripts."""
+    parser.add_argument("--scorer", choices=["roberta", "surrogate"], default="roberta",
+                        help="RoBERTa for audits, the distilled surrogate for fast bulk backfills")
+    parser.add_argument("--surrogate-path", default="models/surrogate_sentiment.joblib",
+                        help="Surrogate trained by scripts/train_surrogate.py")
+    parser.add_argument("--model", default=MODEL_NAME, help="Model name or locally saved model directory")
+    parser.add_argument("--backend", choices=BACKENDS, default="torch", help="Inference runtime for the model")
+    parser.add_argument("--offline", action="store_true", help="Only load models from local files")
+    parser.add_argument("--batch-size", type=int, default=32, help="Reviews per model forward pass")
+    parser.add_argument("--workers", type=int, default=1, help="Scoring processes, each with its own model copy")
+    parser.add_argument("--threads-per-worker", type=int, default=None,
+                        help="Torch threads per worker (default: CPU cores / workers)")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help="SQLite inference cache location")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_MB,
+                        help="Evict old cache entries above this size")
+    parser.add_argument("--no-cache", action="store_true", help="Always run the model, ignoring the cache")
+    parser.add_argument("--token-store", default=None,
+                        help="Directory for reusable pre-tokenized ids (opt-in, skips tokenization on re-scores)")
+    if not checkpoints:
+        return parser
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows scored and checkpointed at a time")
+    parser.add_argument("--checkpoint-dir", default="data/checkpoints", help="Where scored chunks are appended")
+    parser.add_argument("--resume", action="store_true", help="Skip chunks finished by an earlier, interrupted run")
+    return parser
+
+
+def build_scorer(args):
+    cache = None if args.no_cache else InferenceCache(args.cache_path, max_mb=args.cache_max_mb)
+    if args.scorer == "surrogate":
+        from utils.surrogate import SurrogateScorer
+
+        return SurrogateScorer(args.surrogate_path, cache=cache)
+    return BatchSentimentScorer(
+        args.model,
+        batch_size=args.batch_size,
+        cache=cache,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        backend=args.backend,
+        local_files_only=args.offline,
+    )
+
+
+def open_token_store(args, scorer, texts):
+    """Return the token store for `texts` when --token-store is set, building it on first use."""
+    if not args.token_store or scorer.tokenizer is None:
+        return None
+    return load_or_build(args.token_store, texts, scorer.tokenizer, scorer.max_length)
+
+
+def score_in_chunks(texts, scorer, args, name, token_store=None):
+    """Score `texts` chunk by chunk, checkpointing each chunk under --checkpoint-dir/`name`.
+
+    Returns a frame with `label` and `confidence` aligned with `texts`.
+    """
+    texts = list(texts)
+    fingerprint = fingerprint_texts(texts, scorer.model_name, scorer.cache_revision)
+    checkpoint = ScoringCheckpoint(os.path.join(args.checkpoint_dir, name), len(texts), fingerprint,
+                                   args.chunk_size, resume=args.resume)
+    progress = ProgressMeter(len(texts), done=checkpoint.rows_done())
+    for start, end in checkpoint.pending():
+        chunk_store = token_store.rows(start, end) if token_store is not None else None
+        results = scorer.score(texts[start:end], token_store=chunk_store)
+        checkpoint.write_chunk(start, end, results)
+        progress.update(end - start)
+    return checkpoint.load()
+
+
+def score_near_duplicates(texts, cluster_ids, scorer, args, name):
+    """Score the first review of each near-duplicate cluster and copy its result to the other members.
+
+    Returns a frame aligned with `texts`, like score_in_chunks.
+    """
+    texts = list(texts)
+    representatives = [texts[i] for i in first_members(cluster_ids)]
+    print(f"🧬 {len(texts):,} reviews collapse into {len(representatives):,} near-duplicate clusters")
+    token_store = open_token_store(args, scorer, representatives)
+    results = score_in_chunks(representatives, scorer, args, name, token_store=token_store)
+    return expand_to_clusters(results, cluster_ids)
+
+
+def close_scorer(scorer):
+    """Shut down worker processes and print cache statistics."""
+    scorer.close()
+    if scorer.cache is not None:
+        scorer.cache.report()
+        scorer.cache.close()
@@ -0,0 +1,138 @@
+import hashlib
+import os
+import re
+
+import numpy as np
+import torch
+from transformers import AutoModelForSequenceClassification
+
+BACKENDS = ["torch", "int8", "onnx", "onnx-int8"]
+DEFAULT_ONNX_DIR = "models/onnx"
+
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+class TorchBackend:
+    """Plain PyTorch inference, the reference the other backends are checked against."""
+
+    def __init__(self, model_name, revision="main", local_files_only=False):
+        self.model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, revision=revision, local_files_only=local_files_only
+        )
+        self.model.eval()
+
+    def predict(self, batch):
+        with torch.inference_mode():
+            logits = self.model(input_ids=batch["input_ids"], attention_mask=batch["attention_mask"]).logits
+        return torch.softmax(logits, dim=-1).numpy()
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch with Linear layers dynamically quantized to int8 weights."""
+
+    def __init__(self, model_name, revision="main", local_files_only=False):
+        super().__init__(model_name, revision=revision, local_files_only=local_files_only)
+        self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class _LogitsOnly(torch.nn.Module):
+    # ONNX export needs a plain tensor output rather than a ModelOutput
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).logits
+
+
+def _weights_fingerprint(model_dir):
+    # A local directory has no commit to pin, so its files' sizes and mtimes stand in for one
+    digest = hashlib.sha1()
+    for name in sorted(os.listdir(model_dir)):
+        path = os.path.join(model_dir, name)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def onnx_model_path(model_name, revision="main", quantized=False, onnx_dir=DEFAULT_ONNX_DIR):
+    """Where the export of `model_name` lives; re-saving a local model directory gives a new path."""
+    key = f"{model_name.strip('/')}@{revision}"
+    if os.path.isdir(model_name):
+        key += f"-{_weights_fingerprint(model_name)}"
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", key)
+    file_name = "model.int8.onnx" if quantized else "model.onnx"
+    return os.path.join(onnx_dir, safe_name, file_name)
+
+
+def export_onnx(model_name, revision="main", quantized=False, onnx_dir=DEFAULT_ONNX_DIR, local_files_only=False):
+    """Export the model to ONNX once (optionally int8-quantized) and return the file path."""
+    path = onnx_model_path(model_name, revision, quantized=quantized, onnx_dir=onnx_dir)
+    if os.path.exists(path):
+        return path
+
+    if quantized:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        fp32_path = export_onnx(model_name, revision, onnx_dir=onnx_dir, local_files_only=local_files_only)
+        quantize_dynamic(fp32_path, path, weight_type=QuantType.QInt8)
+        return path
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    model = AutoModelForSequenceClassification.from_pretrained(
+        model_name, revision=revision, local_files_only=local_files_only, attn_implementation="eager"
+    )
+    model.eval()
+    dummy = torch.ones((2, 8), dtype=torch.long)
+    torch.onnx.export(
+        _LogitsOnly(model),
+        (dummy, torch.ones_like(dummy)),
+        path,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["logits"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "logits": {0: "batch"},
+        },
+        opset_version=17,
+        dynamo=False,
+    )
+    print(f"📦 Exported ONNX model to: {path}")
+    return path
+
+
+class OnnxBackend:
+    """ONNX Runtime inference on CPU, exporting the model on first use."""
+
+    def __init__(self, model_name, revision="main", local_files_only=False, quantized=False,
+                 onnx_dir=DEFAULT_ONNX_DIR, threads=None):
+        import onnxruntime as ort
+
+        self.path = export_onnx(model_name, revision, quantized=quantized, onnx_dir=onnx_dir,
+                                local_files_only=local_files_only)
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads or torch.get_num_threads()
+        self.session = ort.InferenceSession(self.path, options, providers=["CPUExecutionProvider"])
+
+    def predict(self, batch):
+        feed = {
+            "input_ids": batch["input_ids"].numpy().astype(np.int64),
+            "attention_mask": batch["attention_mask"].numpy().astype(np.int64),
+        }
+        return _softmax(self.session.run(["logits"], feed)[0])
+
+
+def load_backend(name, model_name, revision="main", local_files_only=False):
+    if name == "torch":
+        return TorchBackend(model_name, revision, local_files_only)
+    if name == "int8":
+        return QuantizedTorchBackend(model_name, revision, local_files_only)
+    if name in ("onnx", "onnx-int8"):
+        return OnnxBackend(model_name, revision, local_files_only, quantized=name == "onnx-int8")
+    raise ValueError(f"Unknown backend {name!r}, expected one of {BACKENDS}")
@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+
+from utils.apps import APPS
+from utils.storage import iter_dataset, load_reviews, resolve_path, write_dataset
+
+CUBE_PATH = "data/sentiment_cube.parquet"
+
+# Review counts are kept for every combination of these
+DIMENSIONS = ["app", "month", "appVersion", "hf_sentiment_label", "score"]
+SOURCE_COLUMNS = ["at", "appVersion", "hf_sentiment_label", "score"]
+
+
+def count_reviews(df, app):
+    """Review counts of one app's scored frame by month, version, sentiment and rating."""
+    keys = pd.DataFrame({
+        "app": app,
+        "month": pd.to_datetime(df["at"], errors="coerce").dt.to_period("M").dt.to_timestamp(),
+        "appVersion": df["appVersion"].astype(object).fillna("unknown"),
+        # Rows the model could not score are counted as unscored instead of dropped
+        "hf_sentiment_label": df["hf_sentiment_label"].astype(object).fillna("unscored"),
+        "score": pd.to_numeric(df["score"], errors="coerce"),
+    }, index=df.index)
+    # Reviews without a date or rating still count, under a missing month or score
+    return keys.groupby(DIMENSIONS, observed=True, dropna=False).size().rename("reviews").reset_index()
+
+
+def _combine(parts):
+    parts = [part for part in parts if len(part)]
+    if not parts:
+        return pd.DataFrame(columns=DIMENSIONS + ["reviews"])
+    cube = pd.concat(parts, ignore_index=True)
+    return cube.groupby(DIMENSIONS, observed=True, dropna=False)["reviews"].sum().reset_index()
+
+
+def build_cube(apps=None, chunk_size=50000):
+    """Count every app's scored sample, streaming each dataset in chunks."""
+    parts = []
+    for key in apps or APPS:
+        path = resolve_path(APPS[key]["sampled"])
+        if not os.path.exists(path):
+            print(f"⚠️ Skipping {APPS[key]['name']}: {path} not found")
+            continue
+        for chunk in iter_dataset(path, chunk_size, columns=SOURCE_COLUMNS):
+            parts.append(count_reviews(chunk, key))
+    return _combine(parts)
+
+
+def update_cube(app, df, path=CUBE_PATH):
+    """Replace one app's counts in the cube at `path` with counts of `df`, creating the cube if needed."""
+    cube = load_cube(path) if os.path.exists(resolve_path(path)) else None
+    others = [] if cube is None else [cube[cube["app"] != app]]
+    cube = _combine(others + [count_reviews(df, app)])
+    write_dataset(cube, path)
+    return cube
+
+
+def load_cube(path=CUBE_PATH):
+    """The cube with its compact in-memory types."""
+    return load_reviews(path)
+
+
+def load_or_build_cube(path=CUBE_PATH):
+    """The cube at `path`, building it from every app's scored sample first if it does not exist yet."""
+    if not os.path.exists(resolve_path(path)):
+        print(f"🧮 No sentiment cube at {path}; building it from the scored samples...")
+        write_dataset(build_cube(), path)
+    return load_cube(path)
+
+
+def rollup(cube, by, columns=None, **filters):
+    """Sum review counts by the dimensions in `by`, after keeping only rows matching `filters`.
+
+    With `columns`, that dimension is spread into columns (e.g. one per
+    sentiment), giving a frame ready to plot. Filter values may be a single
+    value or a list, e.g. rollup(cube, ["month"], "hf_sentiment_label", app="zoom").
+    """
+    for dimension, value in filters.items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        cube = cube[cube[dimension].isin(values)]
+    keys = list(by) + ([columns] if columns else [])
+    counts = cube.groupby(keys, observed=True, dropna=False)["reviews"].sum()
+    if columns:
+        return counts.unstack(columns, fill_value=0)
+    return counts
@@ -0,0 +1,289 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import torch
+from transformers import AutoConfig, AutoTokenizer
+
+from utils.inference_cache import normalize_text
+from utils.sentiment_backends import export_onnx, load_backend
+
+MODEL_NAME = "cardiffnlp/twitter-roberta-base-sentiment"
+
+# Map raw model labels to readable sentiment labels
+LABEL_MAP = {
+    "label_0": "negative",
+    "label_1": "neutral",
+    "label_2": "positive",
+    "neutral": "neutral"
+}
+
+
+# Per-process scorer used by the worker pool
+_worker_scorer = None
+
+
+def _init_worker(scorer_kwargs, threads):
+    global _worker_scorer
+    # Fixed thread budget so workers do not fight over the same cores
+    torch.set_num_threads(threads)
+    _worker_scorer = BatchSentimentScorer(**scorer_kwargs)
+
+
+def _predict_shard(shard, pretokenized):
+    if pretokenized:
+        return _worker_scorer._run_encoded(shard)
+    return _worker_scorer._run_texts(shard)
+
+
+def _error_reason(error):
+    return f"{type(error).__name__}: {error}"
+
+
+class SentimentScorer:
+    """Dedupe, cache and bookkeeping shared by the sentiment scorers.
+
+    Subclasses load their model and implement `tokenize`, `_run_texts` and
+    `_run_encoded`, each returning probabilities and error reasons per row.
+    Repeated texts are scored once per run and, when an `InferenceCache` is
+    given, once across runs.
+    """
+
+    def __init__(self, model_name, revision, id2label, batch_size, cache=None, backend_name="torch",
+                 max_length=None, workers=1):
+        self.model_name = model_name
+        self.revision = revision
+        self.id2label = id2label
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache = cache
+        self.workers = workers
+        self.backend_name = backend_name
+        # Quantized, exported or distilled backends can disagree with torch, so they get their own cache entries
+        self.cache_revision = revision if backend_name == "torch" else f"{revision}+{backend_name}"
+        # Only HuggingFace models have a tokenizer, and with it a token store
+        self.tokenizer = None
+        self.pool = None
+        self.last_rows_per_sec = None
+
+    def predict_texts(self, texts):
+        """Return class probabilities for `texts`, in input order (NaN rows failed)."""
+        return self._run_texts(texts)[0]
+
+    def predict_encoded(self, input_ids):
+        """Return class probabilities for already tokenized rows, in input order (NaN rows failed)."""
+        return self._run_encoded(input_ids)[0]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def prepare(self, texts):
+        """Dedupe and cache-check `texts`; returns the state `finish` completes.
+
+        Texts are deduped and cached by their normalized form, but the model
+        sees the original text of the first review with each key
+        (`state["texts"]`), since the model is case-sensitive.
+        `state["todo"]` indexes the distinct keys in `state["uniques"]` that
+        still need the model.
+        """
+        texts = ["" if pd.isna(text) else str(text) for text in texts]
+
+        # Each distinct key is scored once; duplicates reuse its label
+        codes, uniques = pd.factorize(pd.Series([normalize_text(text) for text in texts], dtype=object))
+        first_rows = np.unique(codes, return_index=True)[1]
+        state = {
+            "codes": codes,
+            "uniques": uniques,
+            "texts": [texts[row] for row in first_rows],
+            "labels": np.full(len(uniques), None, dtype=object),
+            "confidence": np.full(len(uniques), np.nan, dtype=np.float32),
+            "errors": np.full(len(uniques), None, dtype=object),
+            "todo": np.arange(len(uniques)),
+            "keys": None,
+        }
+        if self.cache is not None:
+            keys = [self.cache.make_key(text, self.model_name, self.cache_revision) for text in uniques]
+            cached = self.cache.get_many(keys)
+            hit = np.array([key in cached for key in keys], dtype=bool)
+            for i in np.flatnonzero(hit):
+                state["labels"][i], scores = cached[keys[i]]
+                state["confidence"][i] = max(scores)
+            state["todo"] = np.flatnonzero(~hit)
+            state["keys"] = keys
+        return state
+
+    def no_results(self):
+        """Empty probabilities and errors, for a batch with nothing left to score."""
+        return np.zeros((0, len(self.id2label)), dtype=np.float32), np.full(0, None, dtype=object)
+
+    def predict_tokenized(self, input_ids, errors=None):
+        """Probabilities and errors for tokenized rows; rows with `None` ids keep their error."""
+        errors = np.array(errors if errors is not None else [None] * len(input_ids), dtype=object)
+        ok = [i for i, ids in enumerate(input_ids) if ids is not None]
+        probs = np.full((len(input_ids), len(self.id2label)), np.nan, dtype=np.float32)
+        probs[ok], errors[ok] = self._run_encoded([input_ids[i] for i in ok])
+        return probs, errors
+
+    def finish(self, state, probs, errors):
+        """Fill in model results for `state["todo"]` and expand back to one row per input text."""
+        todo, labels, confidence = state["todo"], state["labels"], state["confidence"]
+        state["errors"][todo] = errors
+        scored = np.array([error is None for error in errors], dtype=bool)
+        best = probs[scored].argmax(axis=1)
+        labels[todo[scored]] = [self.id2label[k] for k in best]
+        confidence[todo[scored]] = probs[scored][np.arange(len(best)), best]
+        if self.cache is not None:
+            self.cache.put_many((state["keys"][i], labels[i], p) for i, p in zip(todo[scored], probs[scored]))
+
+        codes = state["codes"]
+        return pd.DataFrame({"label": labels[codes], "confidence": confidence[codes], "error": state["errors"][codes]})
+
+    def score(self, texts, token_store=None):
+        """Score an iterable of texts, returning a frame with `label`, `confidence` and `error`."""
+        start = time.perf_counter()
+        state = self.prepare(texts)
+        if token_store is not None and len(token_store) != len(state["codes"]):
+            raise ValueError(f"Token store has {len(token_store):,} rows but {len(state['codes']):,} texts were given")
+
+        todo = state["todo"]
+        if not len(todo):
+            # Every text was a cache hit
+            probs, errors = self.no_results()
+        elif token_store is not None:
+            # Codes follow first appearance, so this finds each key's first row
+            first_rows = np.unique(state["codes"], return_index=True)[1]
+            probs, errors = self._run_encoded([token_store[row] for row in first_rows[todo]])
+        else:
+            probs, errors = self._run_texts([state["texts"][i] for i in todo])
+        results = self.finish(state, probs, errors)
+
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        self.last_rows_per_sec = len(results) / elapsed
+        print(f"⚡ Scored {len(results):,} reviews ({len(state['uniques']):,} unique, {len(todo):,} through the model) "
+              f"in {elapsed:.1f}s ({self.last_rows_per_sec:.1f} rows/s, "
+              f"batch size {self.batch_size}, {self.workers} worker(s), {self.backend_name} backend)")
+
+        failed = results["error"].notna().sum()
+        if failed:
+            print(f"⚠️ {failed:,} reviews could not be scored; see the `error` column")
+        return results
+
+
+class BatchSentimentScorer(SentimentScorer):
+    """Batched RoBERTa scoring shared by the sentiment scripts.
+
+    Texts are tokenized once, sorted by token length so each batch is padded
+    only to its own longest review, and the labels are written back in the
+    original row order.
+
+    With `workers > 1` the model runs in a pool of processes, each holding its
+    own copy and `threads_per_worker` torch threads; texts are split into
+    shards and the results merged back in order.
+
+    `backend` selects the inference runtime (see `utils.sentiment_backends`);
+    `model_name` may be a locally saved model directory, and
+    `local_files_only=True` keeps every load offline.
+
+    `score` can also take a `TokenStore` holding the token ids of the same
+    rows, in which case nothing is tokenized again.
+
+    A batch that raises is split in half and retried until the offending rows
+    are isolated; only those rows come back without a label, with the reason
+    in the `error` column.
+    """
+
+    def __init__(self, model_name=MODEL_NAME, batch_size=32, max_length=512, revision="main", cache=None,
+                 workers=1, threads_per_worker=None, backend="torch", local_files_only=False):
+        config = AutoConfig.from_pretrained(model_name, revision=revision, local_files_only=local_files_only)
+        super().__init__(model_name, getattr(config, "_commit_hash", None) or revision,
+                         {i: label.lower() for i, label in config.id2label.items()}, batch_size, cache=cache,
+                         backend_name=backend, max_length=max_length, workers=workers)
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            model_name, revision=revision, local_files_only=local_files_only
+        )
+
+        if workers > 1:
+            threads = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+            if backend.startswith("onnx"):
+                # Export once up front instead of racing in every worker
+                export_onnx(model_name, revision, quantized=backend == "onnx-int8", local_files_only=local_files_only)
+            # Spawned workers start with a clean torch thread pool
+            self.pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(dict(model_name=model_name, batch_size=batch_size, max_length=max_length,
+                               revision=revision, backend=backend, local_files_only=local_files_only), threads),
+            )
+        else:
+            if threads_per_worker:
+                torch.set_num_threads(threads_per_worker)
+            self.backend = load_backend(backend, model_name, revision, local_files_only)
+
+    def encode(self, texts):
+        # No padding here: each batch is padded later to its own longest row
+        return self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+
+    def predict_ids(self, input_ids):
+        batch = self.tokenizer.pad({"input_ids": input_ids}, return_tensors="pt")
+        return self.backend.predict(batch)
+
+    def _encode_isolated(self, texts):
+        # Tokenize the whole list at once, bisecting only if something in it fails
+        if not texts:
+            return [], []
+        try:
+            return self.encode(texts), [None] * len(texts)
+        except Exception as error:
+            if len(texts) == 1:
+                return [None], [_error_reason(error)]
+            mid = len(texts) // 2
+            left_ids, left_errors = self._encode_isolated(texts[:mid])
+            right_ids, right_errors = self._encode_isolated(texts[mid:])
+            return left_ids + right_ids, left_errors + right_errors
+
+    def _predict_isolated(self, input_ids, positions, probs, errors):
+        try:
+            probs[positions] = self.predict_ids(input_ids)
+        except Exception as error:
+            if len(input_ids) == 1:
+                errors[positions[0]] = _error_reason(error)
+                return
+            mid = len(input_ids) // 2
+            self._predict_isolated(input_ids[:mid], positions[:mid], probs, errors)
+            self._predict_isolated(input_ids[mid:], positions[mid:], probs, errors)
+
+    def _run_texts(self, texts):
+        if self.pool is not None:
+            return self._predict_sharded(texts, pretokenized=False)
+        return self.predict_tokenized(*self.tokenize(texts))
+
+    def _run_encoded(self, input_ids):
+        if self.pool is not None:
+            return self._predict_sharded(input_ids, pretokenized=True)
+        order = np.argsort([len(ids) for ids in input_ids], kind="stable")
+        probs = np.full((len(input_ids), len(self.id2label)), np.nan, dtype=np.float32)
+        errors = np.full(len(input_ids), None, dtype=object)
+        for i in range(0, len(order), self.batch_size):
+            idx = order[i:i + self.batch_size]
+            self._predict_isolated([input_ids[j] for j in idx], idx, probs, errors)
+        return probs, errors
+
+    def _predict_sharded(self, rows, pretokenized):
+        if not len(rows):
+            return self.no_results()
+        # A few shards per worker keeps the pool balanced when lengths vary
+        n_shards = max(1, min(self.workers * 4, -(-len(rows) // self.batch_size)))
+        bounds = np.linspace(0, len(rows), n_shards + 1).astype(int)
+        shards = [rows[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        results = list(self.pool.map(_predict_shard, shards, [pretokenized] * len(shards)))
+        return np.concatenate([probs for probs, _ in results]), np.concatenate([errors for _, errors in results])
+
+    def tokenize(self, texts):
+        """Token ids per text (None where tokenization failed) and the matching error reasons."""
+        return self._encode_isolated(list(texts))
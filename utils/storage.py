@@ -0,0 +1,223 @@
+import os
+import shutil
+
+import pandas as pd
+
+from utils import partitioned
+from utils.checkpoint import count_csv_rows
+from utils.review_frame import DATETIME_COLUMNS, DERIVED_COLUMNS, add_derived, compact_frame
+
+FORMATS = ["parquet", "csv"]
+
+
+def dataset_format(path):
+    return "csv" if str(path).lower().endswith(".csv") else "parquet"
+
+
+def with_format(path, fmt):
+    """Swap the extension of `path` for the one matching `fmt` ("parquet" or "csv")."""
+    return os.path.splitext(path)[0] + "." + fmt
+
+
+def resolve_path(path):
+    """Return `path`, or its CSV/Parquet sibling when only that one exists (e.g. not yet migrated)."""
+    if os.path.exists(path):
+        return path
+    for fmt in FORMATS:
+        sibling = with_format(path, fmt)
+        if os.path.exists(sibling):
+            return sibling
+    return path
+
+
+def prepare_frame(df):
+    """Give a review frame its storage types (see utils/review_frame.py); derived columns are not stored."""
+    return compact_frame(df)
+
+
+def _drop_derived(df):
+    return df.drop(columns=[column for column in DERIVED_COLUMNS if column in df.columns])
+
+
+def _remove(path):
+    # A partitioned Parquet dataset is a directory of parts
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def read_dataset(path, columns=None):
+    """Load a pipeline dataset from Parquet or CSV, reading only `columns` when given."""
+    path = resolve_path(path)
+    if partitioned.is_partitioned(path):
+        chunks = list(partitioned.iter_parts(path, columns=columns))
+        if not chunks:
+            return pd.DataFrame(columns=columns or partitioned.part_columns(path))
+        return pd.concat(chunks, ignore_index=True)
+    if dataset_format(path) == "csv":
+        header = pd.read_csv(path, nrows=0).columns
+        dates = [column for column in DATETIME_COLUMNS if column in header and (columns is None or column in columns)]
+        return pd.read_csv(path, usecols=columns, parse_dates=dates)
+    return pd.read_parquet(path, columns=columns)
+
+
+def load_reviews(path, columns=None):
+    """Load reviews with the compact in-memory schema, computing derived columns only when asked for.
+
+    Versions and labels come back as categoricals, `score` as int8 and
+    `thumbsUpCount` as the smallest integer type that fits. Derived
+    columns such as `combined` are never read from disk; listing one in
+    `columns` builds it from its source columns after loading.
+    """
+    derived = [column for column in columns or [] if column in DERIVED_COLUMNS]
+    read_columns = None
+    if columns is not None:
+        sources = [source for column in derived for source in DERIVED_COLUMNS[column][1]]
+        stored = dataset_columns(path)
+        read_columns = [column for column in dict.fromkeys(list(columns) + sources)
+                        if column in stored and column not in DERIVED_COLUMNS]
+    df = compact_frame(read_dataset(path, columns=read_columns), downcast=True)
+    df = add_derived(df, derived)
+    return df if columns is None else df[list(columns)]
+
+
+def write_dataset(df, path):
+    """Write a whole frame as typed Parquet, or as CSV when `path` ends in .csv."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _remove(path)
+    if dataset_format(path) == "csv":
+        _drop_derived(df).to_csv(path, index=False)
+    else:
+        prepare_frame(df).to_parquet(path, index=False, compression="zstd")
+
+
+def iter_dataset(path, chunk_size, columns=None):
+    """Yield DataFrame chunks of a Parquet or CSV dataset without loading it whole."""
+    path = resolve_path(path)
+    if dataset_format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_size, usecols=columns)
+        return
+    if partitioned.is_partitioned(path):
+        yield from partitioned.iter_parts(path, chunk_size, columns=columns)
+        return
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        yield batch.to_pandas()
+
+
+def dataset_columns(path):
+    """Column names of a Parquet or CSV dataset, read from its schema or header only."""
+    path = resolve_path(path)
+    if dataset_format(path) == "csv":
+        return pd.read_csv(path, nrows=0).columns.tolist()
+    if partitioned.is_partitioned(path):
+        return partitioned.part_columns(path)
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(path).schema_arrow.names
+
+
+def count_rows(path):
+    """Row count from Parquet metadata, or an approximate line count for CSV."""
+    path = resolve_path(path)
+    if dataset_format(path) == "csv":
+        return count_csv_rows(path)
+    if partitioned.is_partitioned(path):
+        return partitioned.count(path)
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+class DatasetWriter:
+    """Append DataFrame chunks to one Parquet (or CSV) file.
+
+    The Parquet schema is set by the first chunk, with dictionary columns
+    using 32-bit indices so later chunks with new labels or versions still
+    fit. Columns that are still all-null there are provisionally strings;
+    the first chunk that gives one a real type (e.g. float probabilities)
+    rewrites the rows written so far with that type, once per column.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = dataset_format(path)
+        self.schema = None
+        self.writer = None
+        self.untyped = set()
+        self.rows = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        _remove(path)
+
+    def write(self, df):
+        self.rows += len(df)
+        if self.format == "csv":
+            _drop_derived(df).to_csv(self.path, mode="a", header=not os.path.exists(self.path), index=False)
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        df = prepare_frame(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self.writer is None:
+            self.untyped = {field.name for field in table.schema if pa.types.is_null(field.type)}
+            self.schema = pa.schema([self._widen(field) for field in table.schema], metadata=table.schema.metadata)
+            self.writer = pq.ParquetWriter(self.path, self.schema, compression="zstd")
+        elif self.untyped:
+            self._retype(table.schema)
+        df = df.reindex(columns=self.schema.names)
+        self.writer.write_table(pa.Table.from_pandas(df, schema=self.schema, preserve_index=False))
+
+    def _retype(self, incoming):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        typed = {name for name in self.untyped
+                 if name in incoming.names and not pa.types.is_null(incoming.field(name).type)}
+        if not typed:
+            return
+        self.untyped -= typed
+        fields = [self._widen(incoming.field(field.name)) if field.name in typed else field for field in self.schema]
+        # The chunk's pandas metadata describes the newly typed columns
+        schema = pa.schema(fields, metadata=incoming.metadata)
+        self.writer.close()
+        previous = f"{self.path}.retype"
+        os.replace(self.path, previous)
+        self.writer = pq.ParquetWriter(self.path, schema, compression="zstd")
+        written = pq.ParquetFile(previous)
+        for i in range(written.num_row_groups):
+            self.writer.write_table(written.read_row_group(i).cast(schema))
+        os.remove(previous)
+        self.schema = schema
+
+    @staticmethod
+    def _widen(field):
+        import pyarrow as pa
+
+        if pa.types.is_null(field.type):
+            return field.with_type(pa.string())
+        if pa.types.is_dictionary(field.type):
+            value_type = pa.string() if pa.types.is_null(field.type.value_type) else field.type.value_type
+            return field.with_type(pa.dictionary(pa.int32(), value_type))
+        return field
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def add_format_arg(parser):
+    """Register --format, choosing between typed Parquet outputs and a CSV export."""
+    parser.add_argument("--format", choices=FORMATS, default="parquet",
+                        help="Output format: typed Parquet, or CSV for spreadsheet export")
+    return parser
@@ -0,0 +1,139 @@
+import queue
+import threading
+import time
+
+from utils.checkpoint import ProgressMeter
+from utils.review_frame import combined_text
+from utils.sentiment_engine import LABEL_MAP
+from utils.storage import DatasetWriter, count_rows, iter_dataset
+
+# Marks the end of a stream between stages
+_DONE = object()
+
+
+def run_stages(source, stages, queue_depth=4):
+    """Run items from `source` through `stages`, one thread per stage.
+
+    Stages are connected by queues holding at most `queue_depth` items, so
+    memory is bounded by the queue depth rather than by the input size. The
+    first exception raised by any stage stops the pipeline and is re-raised.
+    Returns the busy time in seconds of the reader and each stage.
+    """
+    queues = [queue.Queue(maxsize=queue_depth) for _ in stages]
+    stop = threading.Event()
+    failures = []
+    busy = [0.0] * (len(stages) + 1)
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def read():
+        try:
+            items = iter(source)
+            while True:
+                start = time.perf_counter()
+                item = next(items, _DONE)
+                busy[0] += time.perf_counter() - start
+                if item is _DONE or not put(queues[0], item):
+                    break
+        except BaseException as error:
+            failures.append(error)
+            stop.set()
+        finally:
+            put(queues[0], _DONE)
+
+    def work(position, stage, inbox, outbox):
+        try:
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    break
+                start = time.perf_counter()
+                result = stage(item)
+                busy[position] += time.perf_counter() - start
+                if outbox is not None and not put(outbox, result):
+                    break
+        except BaseException as error:
+            failures.append(error)
+            stop.set()
+        finally:
+            if outbox is not None:
+                put(outbox, _DONE)
+
+    threads = [threading.Thread(target=read, name="reader")]
+    for i, stage in enumerate(stages):
+        outbox = queues[i + 1] if i + 1 < len(stages) else None
+        threads.append(threading.Thread(target=work, args=(i + 1, stage, queues[i], outbox),
+                                        name=getattr(stage, "__name__", f"stage-{i + 1}")))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if failures:
+        raise failures[0]
+    return busy
+
+
+def stream_score_dataset(input_path, output_path, scorer, text_column="combined", chunk_size=5000, queue_depth=4):
+    """Score a dataset of any size with RoBERTa, streaming reader -> tokenizer -> model -> writer.
+
+    Rows are written to `output_path` (Parquet, or CSV by extension) with
+    `hf_sentiment`, `hf_error` and `hf_sentiment_label` appended, in input order.
+    """
+    progress = ProgressMeter(count_rows(input_path))
+    writer = DatasetWriter(output_path)
+
+    def read_chunks():
+        for chunk in iter_dataset(input_path, chunk_size):
+            if text_column not in chunk.columns:
+                # `combined` is the review text followed by its emojis
+                chunk[text_column] = combined_text(chunk)
+            yield chunk
+
+    def tokenize(chunk):
+        state = scorer.prepare(chunk[text_column])
+        if not len(state["todo"]):
+            # Every text was a cache hit
+            return chunk, state, [], []
+        input_ids, errors = scorer.tokenize([state["texts"][i] for i in state["todo"]])
+        return chunk, state, input_ids, errors
+
+    def predict(item):
+        chunk, state, input_ids, errors = item
+        probs, errors = scorer.predict_tokenized(input_ids, errors) if input_ids else scorer.no_results()
+        return chunk, state, probs, errors
+
+    def write(item):
+        chunk, state, probs, errors = item
+        results = scorer.finish(state, probs, errors)
+        chunk["hf_sentiment"] = results["label"].values
+        chunk["hf_error"] = results["error"].values
+        chunk["hf_sentiment_label"] = chunk["hf_sentiment"].map(LABEL_MAP)
+        writer.write(chunk)
+        progress.update(len(chunk))
+
+    start = time.perf_counter()
+    try:
+        busy = run_stages(read_chunks(), [tokenize, predict, write], queue_depth=queue_depth)
+    finally:
+        writer.close()
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    print(f"⚡ Streamed {progress.done:,} reviews in {elapsed:.1f}s ({progress.done / elapsed:.1f} rows/s)")
+    for name, seconds in zip(["reader", "tokenizer", "model", "writer"], busy):
+        print(f"   {name:<9} busy {seconds:6.1f}s ({seconds / elapsed:.0%} of wall time)")
+    return progress.done
@@ -0,0 +1,69 @@
+import hashlib
+import os
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import FeatureUnion, make_pipeline
+
+from utils.inference_cache import normalize_text
+from utils.sentiment_engine import LABEL_MAP, SentimentScorer
+
+DEFAULT_SURROGATE_PATH = "models/surrogate_sentiment.joblib"
+
+# Readable labels back to the raw RoBERTa labels the scorers emit
+RAW_LABELS = {label: raw for raw, label in LABEL_MAP.items() if raw.startswith("label_")}
+
+
+def build_surrogate():
+    """Hashed word and character n-grams feeding a linear classifier."""
+    features = FeatureUnion([
+        ("words", HashingVectorizer(ngram_range=(1, 2), n_features=2 ** 20, alternate_sign=False)),
+        ("chars", HashingVectorizer(analyzer="char_wb", ngram_range=(2, 4), n_features=2 ** 20,
+                                    alternate_sign=False)),
+    ])
+    return make_pipeline(features, LogisticRegression(max_iter=1000, C=4.0))
+
+
+def save_surrogate(model, path=DEFAULT_SURROGATE_PATH, **metadata):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    joblib.dump({"model": model, "metadata": metadata}, path)
+
+
+class SurrogateScorer(SentimentScorer):
+    """Drop-in replacement for the RoBERTa scorer backed by a distilled linear model.
+
+    It emits the same raw labels (`label_0`..`label_2`) and result columns, so
+    scripts can switch between it for bulk backfills and the transformer for
+    audits without other changes.
+    """
+
+    def __init__(self, path=DEFAULT_SURROGATE_PATH, batch_size=4096, cache=None):
+        saved = joblib.load(path)
+        self.model = saved["model"]
+        self.metadata = saved["metadata"]
+        with open(path, "rb") as f:
+            revision = hashlib.sha1(f.read()).hexdigest()[:12]
+        super().__init__(path, revision, dict(enumerate(self.model.classes_)), batch_size, cache=cache,
+                         backend_name="surrogate")
+
+    def tokenize(self, texts):
+        # Features are hashed on the fly, so the text itself is the "encoding";
+        # the surrogate was trained on normalized text, so it is normalized here
+        texts = [normalize_text(text) for text in texts]
+        return texts, [None] * len(texts)
+
+    def _run_texts(self, texts):
+        return self._run_encoded(self.tokenize(texts)[0])
+
+    def _run_encoded(self, texts):
+        probs = np.zeros((len(texts), len(self.id2label)), dtype=np.float32)
+        for i in range(0, len(texts), self.batch_size):
+            probs[i:i + self.batch_size] = self.model.predict_proba(texts[i:i + self.batch_size])
+        return probs, np.full(len(texts), None, dtype=object)
+
+    def score(self, texts, token_store=None):
+        if token_store is not None:
+            raise ValueError("The surrogate scorer works on raw text and cannot use a token store")
+        return super().score(texts)
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+_BUILD_CHUNK = 10000
+
+
+def fingerprint(texts, tokenizer, max_length):
+    """Identify a token store by its tokenizer, truncation and exact input texts."""
+    digest = hashlib.sha1(f"{tokenizer.name_or_path}\0{len(tokenizer)}\0{max_length}".encode("utf-8"))
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class TokenStore:
+    """Pre-tokenized reviews kept on disk as memory-mapped NumPy arrays.
+
+    `ids.bin` holds every row's token ids back to back (int32) and
+    `offsets.npy` the row boundaries, so row `i` is
+    `ids[offsets[i]:offsets[i + 1]]`. Re-scoring with a new model head or
+    threshold can then skip tokenization entirely.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode="r")
+        if self.offsets[-1] > 0:
+            self.ids = np.memmap(os.path.join(path, "ids.bin"), dtype=np.int32, mode="r")
+        else:
+            self.ids = np.zeros(0, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.ids[self.offsets[i]:self.offsets[i + 1]].tolist()
+
+    def rows(self, start, end):
+        """A view of rows `start:end` sharing the same memory-mapped ids."""
+        view = TokenStore.__new__(TokenStore)
+        view.path, view.meta, view.ids = self.path, self.meta, self.ids
+        view.offsets = self.offsets[start:end + 1]
+        return view
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @classmethod
+    def build(cls, path, texts, tokenizer, max_length=512):
+        """Tokenize `texts` once, streaming ids to disk chunk by chunk."""
+        texts = ["" if text is None else str(text) for text in texts]
+        os.makedirs(path, exist_ok=True)
+        lengths = []
+        with open(os.path.join(path, "ids.bin"), "wb") as f:
+            for i in range(0, len(texts), _BUILD_CHUNK):
+                encoded = tokenizer(texts[i:i + _BUILD_CHUNK], truncation=True, max_length=max_length)["input_ids"]
+                for ids in encoded:
+                    f.write(np.asarray(ids, dtype=np.int32).tobytes())
+                    lengths.append(len(ids))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        np.save(os.path.join(path, "offsets.npy"), offsets)
+        meta = {
+            "tokenizer": tokenizer.name_or_path,
+            "max_length": max_length,
+            "rows": len(texts),
+            "tokens": int(offsets[-1]),
+            "fingerprint": fingerprint(texts, tokenizer, max_length),
+        }
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        return cls(path)
+
+
+def load_or_build(path, texts, tokenizer, max_length=512):
+    """Reuse the store at `path` if it matches `texts`, otherwise (re)build it."""
+    texts = ["" if text is None else str(text) for text in texts]
+    meta_path = os.path.join(path, "meta.json")
+    if os.path.exists(meta_path):
+        store = TokenStore(path)
+        if store.meta.get("fingerprint") == fingerprint(texts, tokenizer, max_length):
+            print(f"♻️ Reusing {len(store):,} pre-tokenized reviews from: {path}")
+            return store
+    print(f"✂️ Tokenizing {len(texts):,} reviews into: {path}")
+    return TokenStore.build(path, texts, tokenizer, max_length)
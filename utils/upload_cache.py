@@ -0,0 +1,95 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.review_frame import DATETIME_COLUMNS, compact_frame
+
+DEFAULT_MAX_MB = 512
+# Rows parsed per CSV chunk, between progress updates
+UPLOAD_CHUNK_ROWS = 100_000
+
+
+def content_hash(data):
+    """Key of an upload: the digest of its bytes, so a re-upload of the same file hits the cache."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def parse_upload(data, name, chunk_rows=UPLOAD_CHUNK_ROWS, progress=None):
+    """Parse an uploaded CSV or Parquet file into a compactly typed frame.
+
+    CSVs are read in chunks of `chunk_rows`, parsing timestamps as they go,
+    and `progress(fraction)` is called after each chunk. Review columns
+    then get the compact schema (categorical versions and labels, small
+    integers); other columns keep the types pandas inferred.
+    """
+    buffer = io.BytesIO(data)
+    if name.lower().endswith(".parquet"):
+        df = pd.read_parquet(buffer)
+    else:
+        header = pd.read_csv(io.BytesIO(data), nrows=0).columns
+        dates = [column for column in DATETIME_COLUMNS if column in header]
+        chunks = []
+        for chunk in pd.read_csv(buffer, chunksize=chunk_rows, parse_dates=dates):
+            chunks.append(chunk)
+            if progress is not None:
+                progress(min(buffer.tell() / max(len(data), 1), 1.0))
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=header)
+    if progress is not None:
+        progress(1.0)
+    return compact_frame(df, downcast=True)
+
+
+class UploadCache:
+    """Parsed uploads keyed by content hash, shared by every session.
+
+    Entries are evicted least-recently-used first once their combined
+    in-memory size exceeds `max_mb`; a single frame larger than that is
+    returned without being cached. Sessions run in threads, so access goes
+    through a lock.
+    """
+
+    def __init__(self, max_mb=DEFAULT_MAX_MB):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+    def put(self, key, df):
+        size = int(df.memory_usage(deep=True).sum())
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (df, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted
+
+    def load(self, data, name, progress=None):
+        """The parsed frame for uploaded bytes, parsing only on a cache miss."""
+        key = content_hash(data)
+        df = self.get(key)
+        if df is None:
+            df = parse_upload(data, name, progress=progress)
+            self.put(key, df)
+        return df
+
+    def stats(self):
+        return {"entries": len(self.entries), "mb": self.total_bytes / 1024 / 1024,
+                "hits": self.hits, "misses": self.misses}
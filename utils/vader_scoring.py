@@ -0,0 +1,76 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+# Compound score cut-offs used throughout the project
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+# One analyzer per process, built once by the pool initializer
+_analyzer = None
+
+
+def _init_worker():
+    global _analyzer
+    _analyzer = SentimentIntensityAnalyzer()
+
+
+def _compound_chunk(texts):
+    if _analyzer is None:
+        _init_worker()
+    return np.array([_analyzer.polarity_scores(text)["compound"] for text in texts], dtype=np.float64)
+
+
+def label_scores(scores):
+    """Vectorized positive / negative / neutral labels from compound scores."""
+    scores = np.asarray(scores)
+    return np.select([scores >= POSITIVE_THRESHOLD, scores <= NEGATIVE_THRESHOLD],
+                     ["positive", "negative"], default="neutral")
+
+
+class VaderEngine:
+    """VADER compound scores for whole columns at once.
+
+    Each distinct text is scored once. With `workers > 1` the distinct texts
+    are spread over a process pool in large chunks, each worker reusing a
+    single analyzer.
+    """
+
+    def __init__(self, workers=1, chunk_size=20000):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.pool = None
+        if workers > 1:
+            self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                            initializer=_init_worker)
+
+    def compound(self, texts):
+        start = time.perf_counter()
+        texts = pd.Series(texts, dtype=object).fillna("").astype(str)
+        codes, uniques = pd.factorize(texts)
+        uniques = list(uniques)
+
+        chunks = [uniques[i:i + self.chunk_size] for i in range(0, len(uniques), self.chunk_size)]
+        if self.pool is not None and len(chunks) > 1:
+            scores = np.concatenate(list(self.pool.map(_compound_chunk, chunks)))
+        else:
+            scores = _compound_chunk(uniques)
+
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        print(f"⚡ VADER scored {len(texts):,} reviews ({len(uniques):,} unique) in {elapsed:.1f}s "
+              f"({len(texts) / elapsed:,.0f} rows/s, {self.workers} worker(s))")
+        return scores[codes] if len(uniques) else np.zeros(len(texts), dtype=np.float64)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+
+def default_workers():
+    return max(1, (os.cpu_count() or 1) - 1)